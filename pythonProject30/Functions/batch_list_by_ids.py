@@ -0,0 +1,33 @@
+from googleapiclient.errors import HttpError
+
+
+def batch_list_by_ids(list_method, ids, part, batch_size=50, cache=None, resource=None, **kwargs):
+    # Drop empties/NaN and duplicates while keeping first-seen order
+    unique_ids = list(dict.fromkeys(i for i in ids if isinstance(i, str) and i))
+
+    # 💽 Serve what we can from the on-disk cache, only request the rest
+    scope = "|".join([part] + [f"{key}={value}" for key, value in sorted(kwargs.items())])
+    cached = cache.get_many(resource, scope, unique_ids) if cache is not None else {}
+    missing_ids = [i for i in unique_ids if i not in cached]
+
+    fetched = {}
+    for i in range(0, len(missing_ids), batch_size):
+        batch_ids = missing_ids[i:i + batch_size]
+        try:
+            response = list_method(
+                part=part,
+                id=",".join(batch_ids),
+                **kwargs
+            ).execute()
+        except HttpError as e:
+            print(f" Error fetching batch of {len(batch_ids)} IDs: {e}")
+            continue
+
+        for item in response.get("items", []):
+            fetched[item["id"]] = item
+
+    if cache is not None:
+        cache.set_many(resource, scope, fetched)
+
+    items = {**cached, **fetched}
+    return {i: items[i] for i in unique_ids if i in items}
@@ -0,0 +1,107 @@
+import pandas as pd
+from datetime import datetime
+from Functions.extract_video_id_from_url import extract_video_id_from_url
+from Functions.extract_hashtags import extract_hashtags
+from Functions.batch_list_by_ids import batch_list_by_ids
+
+METADATA_COLUMNS = [
+    'subscriber_count',
+    'channel_age_days',
+    'language',
+    'category_id',
+    'category_name',
+    'hashtags',
+    'channel_description',
+]
+
+
+def enrich_video_df_with_metadata(df, youtube, cache=None):
+    if df.empty:
+        return df
+
+    if 'video_id' not in df.columns:
+        if 'url' in df.columns:
+            df['video_id'] = df['url'].apply(extract_video_id_from_url)
+        else:
+            raise ValueError("DataFrame must contain either 'video_id' or 'url' column.")
+
+    # 📦 Videos: one videos.list call per 50 IDs. Same parts (and quota cost) as
+    #    get_sorted_recent_videos_df so the cached details are reused here
+    videos = batch_list_by_ids(
+        youtube.videos().list,
+        df['video_id'],
+        part="snippet,statistics,contentDetails",
+        cache=cache,
+        resource='videos'
+    )
+    video_rows = []
+    for vid, item in videos.items():
+        snippet = item['snippet']
+        video_rows.append({
+            'video_id': vid,
+            'channel_id': snippet.get('channelId'),
+            'language': snippet.get('defaultLanguage') or snippet.get('language') or 'unknown',
+            'category_id': snippet.get('categoryId'),
+            'hashtags': extract_hashtags(snippet.get('title', '') + " " + snippet.get('description', '')),
+        })
+    video_meta = pd.DataFrame(
+        video_rows,
+        columns=['video_id', 'channel_id', 'language', 'category_id', 'hashtags']
+    )
+
+    # 📦 Channels: one channels.list call per 50 distinct channel IDs
+    channels = batch_list_by_ids(
+        youtube.channels().list,
+        video_meta['channel_id'],
+        part="statistics,snippet",
+        cache=cache,
+        resource='channels'
+    )
+    channel_meta = pd.DataFrame(
+        [
+            {
+                'channel_id': cid,
+                'subscriber_count': int(item['statistics'].get('subscriberCount', 0)),
+                'channel_created': item['snippet']['publishedAt'],
+                'channel_description': item['snippet'].get('description', ''),
+            }
+            for cid, item in channels.items()
+        ],
+        columns=['channel_id', 'subscriber_count', 'channel_created', 'channel_description']
+    )
+    created_dt = pd.to_datetime(channel_meta['channel_created'], errors='coerce', utc=True)
+    channel_meta['channel_age_days'] = (pd.Timestamp(datetime.utcnow(), tz='UTC') - created_dt).dt.days
+
+    # 📦 Categories: one videoCategories.list call for all distinct category IDs
+    categories = batch_list_by_ids(
+        youtube.videoCategories().list,
+        video_meta['category_id'],
+        part="snippet",
+        cache=cache,
+        resource='videoCategories',
+        regionCode="US"
+    )
+    category_map = {cat_id: item['snippet']['title'] for cat_id, item in categories.items()}
+
+    # 🔗 Join everything back onto the rows (left joins keep the row order)
+    enriched = (
+        df[['video_id']]
+        .merge(video_meta, on='video_id', how='left')
+        .merge(channel_meta, on='channel_id', how='left')
+    )
+    enriched['category_name'] = enriched['category_id'].map(category_map).fillna("Unknown")
+
+    # Rows whose video or channel could not be resolved get no metadata at all
+    resolved = enriched['channel_id'].isin(channel_meta['channel_id'])
+    for vid in enriched.loc[~resolved, 'video_id']:
+        print(f"⚠️ Error with video {vid}: video or channel not found")
+
+    enriched['subscriber_count'] = enriched['subscriber_count'].astype('Int64')
+    enriched['channel_age_days'] = enriched['channel_age_days'].astype('Int64')
+    enriched = enriched[METADATA_COLUMNS].astype(object)
+    enriched.loc[~resolved, METADATA_COLUMNS] = None
+
+    for column in METADATA_COLUMNS:
+        df[column] = enriched[column].to_numpy()
+
+    return df
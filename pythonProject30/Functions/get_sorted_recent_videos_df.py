@@ -1,8 +1,9 @@
 import pandas as pd
 import isodate
 from googleapiclient.errors import HttpError
+from Functions.batch_list_by_ids import batch_list_by_ids
 
-def get_sorted_recent_videos_df(youtube, published_after, max_results=100):
+def get_sorted_recent_videos_df(youtube, published_after, max_results=100, cache=None):
     video_ids = []
     next_page_token = None
 
@@ -30,39 +31,36 @@ def get_sorted_recent_videos_df(youtube, published_after, max_results=100):
     video_ids = video_ids[:max_results]
     print(f" Found {len(video_ids)} video IDs.")
 
-    # --- Get video details ---
+    # --- Get video details (50 IDs per call, cached statistics reused) ---
     videos_data = []
 
     print(" Fetching video details...")
-    for i in range(0, len(video_ids), 50):
-        batch_ids = video_ids[i:i+50]
-        try:
-            details_response = youtube.videos().list(
-                part="snippet,statistics,contentDetails",
-                id=",".join(batch_ids)
-            ).execute()
-        except HttpError as e:
-            print(f" Error fetching details for batch: {e}")
-            continue
+    details = batch_list_by_ids(
+        youtube.videos().list,
+        video_ids,
+        part="snippet,statistics,contentDetails",
+        cache=cache,
+        resource='videos'
+    )
 
-        for video in details_response.get("items", []):
-            try:
-                duration = isodate.parse_duration(video["contentDetails"]["duration"]).total_seconds()
-                if duration < 120:  # skip videos shorter than 2 minutes
-                    continue
+    for video in details.values():
+        try:
+            duration = isodate.parse_duration(video["contentDetails"]["duration"]).total_seconds()
+            if duration < 120:  # skip videos shorter than 2 minutes
+                continue
 
-                videos_data.append({
-                    "title": video["snippet"]["title"],
-                    "channel": video["snippet"]["channelTitle"],
-                    "publishedAt": video["snippet"]["publishedAt"],
-                    "duration_min": round(duration / 60, 2),
-                    "views": int(video["statistics"].get("viewCount", 0)),
-                    "likes": int(video["statistics"].get("likeCount", 0)),
-                    "comments": int(video["statistics"].get("commentCount", 0)),
-                    "url": f"https://www.youtube.com/watch?v={video['id']}"
-                })
-            except Exception as e:
-                print(f" Skipping video due to error: {e}")
+            videos_data.append({
+                "title": video["snippet"]["title"],
+                "channel": video["snippet"]["channelTitle"],
+                "publishedAt": video["snippet"]["publishedAt"],
+                "duration_min": round(duration / 60, 2),
+                "views": int(video["statistics"].get("viewCount", 0)),
+                "likes": int(video["statistics"].get("likeCount", 0)),
+                "comments": int(video["statistics"].get("commentCount", 0)),
+                "url": f"https://www.youtube.com/watch?v={video['id']}"
+            })
+        except Exception as e:
+            print(f" Skipping video due to error: {e}")
 
     if not videos_data:
         print(" No valid videos found.")
@@ -0,0 +1,11 @@
+import pandas as pd
+
+
+def index_df_by_published_at(df):
+    if df.empty:
+        return df
+
+    # Sorted DatetimeIndex so each window is a binary-search slice
+    indexed = df.copy()
+    indexed.index = pd.DatetimeIndex(pd.to_datetime(indexed['publishedAt'], utc=True))
+    return indexed.sort_index()
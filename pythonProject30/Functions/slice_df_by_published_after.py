@@ -0,0 +1,12 @@
+import pandas as pd
+
+
+def slice_df_by_published_after(indexed_df, published_after):
+    if indexed_df.empty:
+        return indexed_df.reset_index(drop=True)
+
+    cutoff = pd.Timestamp(published_after)
+    window = indexed_df.loc[cutoff:]
+
+    # Same ordering get_sorted_recent_videos_df returns: most viewed first
+    return window.sort_values(by="views", ascending=False).reset_index(drop=True)
@@ -0,0 +1,86 @@
+import json
+import sqlite3
+import time
+from collections import defaultdict
+
+# ⏱️ Time-to-live per API resource (seconds)
+DEFAULT_TTLS = {
+    'videoCategories': 30 * 24 * 3600,  # categories barely change: weeks
+    'channels': 24 * 3600,              # subscriber counts / descriptions: a day
+    'videos': 3600,                     # view/like/comment statistics: an hour
+}
+
+
+class YouTubeResponseCache:
+    def __init__(self, db_path="youtube_api_cache.sqlite", ttls=None):
+        self.db_path = db_path
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.hits = defaultdict(int)
+        self.misses = defaultdict(int)
+
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " resource TEXT NOT NULL,"
+            " scope TEXT NOT NULL,"
+            " item_id TEXT NOT NULL,"
+            " payload TEXT NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " PRIMARY KEY (resource, scope, item_id))"
+        )
+        self.conn.commit()
+        self.purge_expired()
+
+    def purge_expired(self):
+        deleted = self.conn.execute(
+            "DELETE FROM responses WHERE expires_at < ?", (time.time(),)
+        ).rowcount
+        self.conn.commit()
+        return deleted
+
+    def get_many(self, resource, scope, item_ids):
+        found = {}
+        now = time.time()
+        for i in range(0, len(item_ids), 500):
+            chunk = item_ids[i:i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT item_id, payload FROM responses"
+                f" WHERE resource = ? AND scope = ? AND expires_at >= ?"
+                f" AND item_id IN ({placeholders})",
+                (resource, scope, now, *chunk)
+            ).fetchall()
+            for item_id, payload in rows:
+                found[item_id] = json.loads(payload)
+
+        self.hits[resource] += len(found)
+        self.misses[resource] += len(item_ids) - len(found)
+        return found
+
+    def set_many(self, resource, scope, items):
+        if not items:
+            return
+        expires_at = time.time() + self.ttls.get(resource, 3600)
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO responses (resource, scope, item_id, payload, expires_at)"
+            " VALUES (?, ?, ?, ?, ?)",
+            [(resource, scope, item_id, json.dumps(item), expires_at) for item_id, item in items.items()]
+        )
+        self.conn.commit()
+
+    def stats(self):
+        resources = sorted(set(self.hits) | set(self.misses))
+        return {
+            resource: {'hits': self.hits[resource], 'misses': self.misses[resource]}
+            for resource in resources
+        }
+
+    def print_stats(self):
+        print("\n📈 API cache statistics:")
+        for resource, counts in self.stats().items():
+            lookups = counts['hits'] + counts['misses']
+            hit_rate = counts['hits'] / lookups * 100 if lookups else 0.0
+            print(f"   {resource}: {counts['hits']} hits, {counts['misses']} misses ({hit_rate:.1f}% served from cache)")
+
+    def close(self):
+        self.conn.close()
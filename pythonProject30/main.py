@@ -9,6 +9,10 @@ from Functions.get_published_after_days_ago import get_published_after_days_ago
 from Functions.get_sorted_recent_videos_df import get_sorted_recent_videos_df
 from Functions.save_df_to_dated_folder import save_df_to_dated_folder
 from Functions.enrich_video_csv_with_metadata import enrich_video_csv_with_metadata
+from Functions.enrich_video_df_with_metadata import enrich_video_df_with_metadata
+from Functions.index_df_by_published_at import index_df_by_published_at
+from Functions.slice_df_by_published_after import slice_df_by_published_after
+from Functions.youtube_response_cache import YouTubeResponseCache
 
 # 🔐 YouTube API Key
 YOUTUBE_API_KEY = '...'
@@ -16,21 +20,58 @@ YOUTUBE_API_KEY = '...'
 # 🎬 Initialize YouTube API client
 youtube = get_youtube_client(YOUTUBE_API_KEY)
 
-# 🔁 Loop from day 1 to 90
-for N in range(1, 25):
-    print(f"\n Processing data for the last {N} day(s)...")
+# 💽 On-disk API response cache shared by search details and enrichment
+api_cache = YouTubeResponseCache("youtube_api_cache.sqlite")
 
-    # ⏱️ Get timestamp N days ago
-    published_after = get_published_after_days_ago(N)
+# 🔁 Widest window: last_1_days ... last_{MAX_DAYS}_days
+MAX_DAYS = 24
 
-    # 📊 Extract & sort videos
-    df = get_sorted_recent_videos_df(youtube, published_after, max_results=100)
+# ⚡ Collect once, slice many: search + enrich the widest window a single time
+#    and write every last_{N}_days CSV as a publishedAt slice of it
+COLLECT_ONCE = True
 
-    # 💾 Save CSV to a dated folder
-    filename = save_df_to_dated_folder(df, N)
+if COLLECT_ONCE:
+    print(f"\n Collecting data once for the last {MAX_DAYS} day(s)...")
 
-    # 🧠 Enrich CSV with metadata
-    enriched_filename = enrich_video_csv_with_metadata(filename, YOUTUBE_API_KEY)
+    # 📊 Extract, sort & enrich the superset
+    df = get_sorted_recent_videos_df(
+        youtube, get_published_after_days_ago(MAX_DAYS), max_results=100, cache=api_cache
+    )
+    df = enrich_video_df_with_metadata(df, youtube, cache=api_cache)
 
-    print(f"✅ Finished processing for last {N} day(s): {enriched_filename}")
+    # 🗂️ Keep it in memory keyed by publishedAt
+    videos_by_published_at = index_df_by_published_at(df)
 
+    for N in range(1, MAX_DAYS + 1):
+        print(f"\n Processing data for the last {N} day(s)...")
+
+        # ✂️ Filtered view of the superset
+        window_df = slice_df_by_published_after(videos_by_published_at, get_published_after_days_ago(N))
+
+        # 💾 Save CSV to a dated folder
+        filename = save_df_to_dated_folder(window_df, N)
+
+        print(f"✅ Finished processing for last {N} day(s): {filename}")
+
+else:
+    # 🔁 One search + enrichment per window
+    for N in range(1, MAX_DAYS + 1):
+        print(f"\n Processing data for the last {N} day(s)...")
+
+        # ⏱️ Get timestamp N days ago
+        published_after = get_published_after_days_ago(N)
+
+        # 📊 Extract & sort videos
+        df = get_sorted_recent_videos_df(youtube, published_after, max_results=100, cache=api_cache)
+
+        # 💾 Save CSV to a dated folder
+        filename = save_df_to_dated_folder(df, N)
+
+        # 🧠 Enrich CSV with metadata
+        enriched_filename = enrich_video_csv_with_metadata(filename, YOUTUBE_API_KEY, cache=api_cache)
+
+        print(f"✅ Finished processing for last {N} day(s): {enriched_filename}")
+
+# 📈 Quota saved by the cache
+api_cache.print_stats()
+api_cache.close()
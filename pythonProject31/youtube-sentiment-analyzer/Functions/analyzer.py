@@ -3,24 +3,43 @@ Main YouTube Sentiment Analyzer class
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from .sentiment_analysis import EMOTION_KEYWORDS, analyze_sentiment, analyze_emotions
 from .csv_processing import load_csv_and_process
-from .visualization import create_visualizations
+from .result_store import ResultStore
+from .visualization import (VISUALIZATION_DPI, VISUALIZATION_FORMAT, RENDER_IN_BACKGROUND,
+                            create_visualizations, start_visualizations)
 from .reporting import generate_report, save_results
 
 
 class YouTubeSentimentAnalyzer:
-    def __init__(self, csv_file_path, output_folder=None):
+    def __init__(self, csv_file_path, output_folder=None, exact_overall_scores=False, dataframe=None,
+                 incremental=True, dpi=VISUALIZATION_DPI, image_format=VISUALIZATION_FORMAT,
+                 render_in_background=RENDER_IN_BACKGROUND):
         """
         Initialize the YouTube Sentiment Analyzer
 
         Args:
             csv_file_path (str): Path to the CSV file containing video IDs/URLs
             output_folder (str): Path to folder where all output files will be saved
+            exact_overall_scores (bool): Score each full transcript for the overall results
+                                         instead of aggregating segment scores
+            dataframe (pd.DataFrame): Already parsed CSV contents, so the file is not read again
+            incremental (bool): Reuse results archived by earlier runs for videos whose transcript is unchanged
+            dpi (int): Resolution of the visualization image
+            image_format (str): Visualization format (png, jpg, svg, pdf)
+            render_in_background (bool): Render the visualization in a worker process while
+                                         the report and CSVs are written
         """
         self.csv_file_path = csv_file_path
-        self.results = []
+        self.dataframe = dataframe
+        self.exact_overall_scores = exact_overall_scores
+        self.incremental = incremental
+        self.dpi = dpi
+        self.image_format = image_format
+        self.render_in_background = render_in_background
+        self.results = ResultStore(EMOTION_KEYWORDS)
         self.emotion_keywords = EMOTION_KEYWORDS
         
         # Set up output folder
@@ -44,8 +63,14 @@ class YouTubeSentimentAnalyzer:
         success, results = load_csv_and_process(
             self.csv_file_path, 
             analyze_sentiment, 
-            analyze_emotions
+            analyze_emotions,
+            exact_overall_scores=self.exact_overall_scores,
+            df=self.dataframe,
+            incremental=self.incremental
         )
+
+        # The analysis has its own copy of everything it needs
+        self.dataframe = None
         
         if not success:
             print("❌ Analysis failed - could not process videos or CSV is empty")
@@ -61,17 +86,31 @@ class YouTubeSentimentAnalyzer:
         print("\n🎯 Analysis completed successfully!")
         print("=" * 50)
 
-        # Generate report
-        print("\n📋 Generating comprehensive report...")
-        generate_report(self.results, self.csv_file_path, self.output_folder)
-
-        # Create visualizations  
+        # Create visualizations (in a worker process, off the critical path)
         print("\n📊 Creating visualizations...")
-        create_visualizations(self.results, self.emotion_keywords, self.output_folder)
+        if self.render_in_background:
+            visualization = start_visualizations(self.results, self.emotion_keywords, self.output_folder,
+                                                 self.dpi, self.image_format)
+        else:
+            create_visualizations(self.results, self.emotion_keywords, self.output_folder,
+                                  self.dpi, self.image_format)
+            visualization = None
+
+        # Generate report and save results concurrently
+        print("\n📋 Generating comprehensive report and saving results...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            report = executor.submit(generate_report, self.results, self.csv_file_path, self.output_folder)
+            saved = executor.submit(save_results, self.results, self.emotion_keywords, self.output_folder)
+            report.result()
+            saved.result()
 
-        # Save results
-        print("\n💾 Saving results...")
-        save_results(self.results, self.emotion_keywords, self.output_folder)
+        if visualization is not None:
+            try:
+                output_filename = visualization.result()
+                if output_filename:
+                    print(f"📊 Visualization saved as: {output_filename}")
+            except Exception as e:
+                print(f"❌ Error creating visualizations: {str(e)}")
 
         print(f"\n🎉 Complete! Successfully analyzed {len(self.results)} videos.")
         print(f"📁 All files saved in: {self.output_folder}")
@@ -0,0 +1,241 @@
+"""
+Caching functions for YouTube Sentiment Analyzer
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+
+# Default cache locations and limits
+CACHE_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache")
+TRANSCRIPT_CACHE_DIR = os.path.join(CACHE_ROOT, "transcripts")
+TRANSCRIPT_CACHE_MAX_BYTES = 512 * 1024 * 1024  # 512 MB of compressed transcripts
+RESULT_CACHE_MAX_ENTRIES = 1024  # Per-video results kept in memory
+RESULT_ARCHIVE_DIR = os.path.join(CACHE_ROOT, "results")
+RESULT_ARCHIVE_MAX_AGE_DAYS = 30  # Archived results unused for this long are evicted
+
+# Bump whenever segmentation or scoring changes, so archived results from older code are not reused
+ANALYZER_VERSION = "1"
+
+
+def transcript_hash(transcript_list):
+    """Content hash of a transcript list (text and timings)"""
+    payload = json.dumps(transcript_list, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class TranscriptStore:
+    """On-disk transcript store: one gzip-compressed JSON file per video ID, LRU-evicted by size"""
+
+    def __init__(self, cache_dir=TRANSCRIPT_CACHE_DIR, max_bytes=TRANSCRIPT_CACHE_MAX_BYTES):
+        """
+        Initialize the transcript store
+
+        Args:
+            cache_dir (str): Folder holding the compressed transcripts
+            max_bytes (int): Size cap; least recently used transcripts are evicted beyond it
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.total_bytes = None  # Computed lazily on first write
+
+    def path_for(self, video_id):
+        """Get the file path for a video ID (sharded by the first two characters)"""
+        return os.path.join(self.cache_dir, video_id[:2], f"{video_id}.json.gz")
+
+    def get(self, video_id):
+        """Return the cached transcript list for a video, or None on a miss"""
+        path = self.path_for(video_id)
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                transcript_list = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        # Touch the file so eviction sees it as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return transcript_list
+
+    def put(self, video_id, transcript_list):
+        """Store a transcript list, evicting old entries if the store grows past its cap"""
+        path = self.path_for(video_id)
+
+        # Write to a temp file and rename so readers never see a partial file
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with gzip.open(temp_path, 'wt', encoding='utf-8') as f:
+                json.dump(transcript_list, f, ensure_ascii=False)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"  ⚠️  Could not cache transcript for video {video_id}: {str(e)}")
+            return
+
+        with self.lock:
+            if self.total_bytes is None:
+                self.total_bytes = sum(size for _, size, _ in self._scan())
+            else:
+                self.total_bytes += os.path.getsize(path)
+
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+
+    def _scan(self):
+        """List (path, size, last_used) for every cached transcript"""
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith('.json.gz'):
+                    continue
+                file_path = os.path.join(root, name)
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    continue
+                entries.append((file_path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _evict(self):
+        """Delete least recently used transcripts until the store is back under 90% of its cap"""
+        entries = sorted(self._scan(), key=lambda entry: entry[2])
+        self.total_bytes = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+
+        for file_path, size, _ in entries:
+            if self.total_bytes <= target:
+                break
+            try:
+                os.remove(file_path)
+                self.total_bytes -= size
+            except OSError:
+                continue
+
+
+class ResultCache:
+    """Thread-safe in-memory LRU cache of per-video analysis results"""
+
+    def __init__(self, max_entries=RESULT_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def __contains__(self, key):
+        with self.lock:
+            return key in self.entries
+
+    def get(self, key):
+        """Return the cached value (marking it recently used), or None on a miss"""
+        with self.lock:
+            if key not in self.entries:
+                return None
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+    def put(self, key, value):
+        """Store a value, dropping the least recently used entry when full"""
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+
+class ResultArchive:
+    """
+    On-disk archive of per-video analysis results keyed by (video ID, transcript hash, analyzer version)
+
+    Lets a day's run reuse results computed on earlier days: only videos that are
+    new, whose transcript changed or that were analyzed by an older analyzer
+    version are recomputed. Entries not used for max_age_days are evicted.
+    """
+
+    def __init__(self, cache_dir=RESULT_ARCHIVE_DIR, max_age_days=RESULT_ARCHIVE_MAX_AGE_DAYS):
+        """
+        Initialize the result archive
+
+        Args:
+            cache_dir (str): Folder holding the compressed results
+            max_age_days (float): Entries not read or written for this many days are evicted
+        """
+        self.cache_dir = cache_dir
+        self.max_age_days = max_age_days
+        self.lock = threading.Lock()
+        self.evicted = False  # Stale entries are swept once per interpreter, on first write
+
+    def path_for(self, video_id, content_hash, version):
+        """Get the file path for a result key (sharded by the first two characters of the video ID)"""
+        return os.path.join(self.cache_dir, video_id[:2], f"{video_id}_{content_hash[:16]}_v{version}.json.gz")
+
+    def get(self, video_id, content_hash, version):
+        """Return the archived result for a key, or None on a miss"""
+        path = self.path_for(video_id, content_hash, version)
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                video_result = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        # Touch the file so eviction sees it as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return video_result
+
+    def put(self, video_id, content_hash, version, video_result):
+        """Archive a result, replacing older entries for the same video"""
+        path = self.path_for(video_id, content_hash, version)
+
+        # Write to a temp file and rename so readers never see a partial file
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with gzip.open(temp_path, 'wt', encoding='utf-8') as f:
+                json.dump(video_result, f, ensure_ascii=False, default=float)
+            os.replace(temp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"  ⚠️  Could not archive results for video {video_id}: {str(e)}")
+            return
+
+        # A changed transcript or a new analyzer version supersedes the older entries of this video
+        shard = os.path.dirname(path)
+        for name in os.listdir(shard):
+            if name.startswith(f"{video_id}_") and name.endswith('.json.gz') and name != os.path.basename(path):
+                try:
+                    os.remove(os.path.join(shard, name))
+                except OSError:
+                    continue
+
+        with self.lock:
+            if not self.evicted:
+                self.evicted = True
+                self.evict_stale()
+
+    def evict_stale(self):
+        """Delete entries that were not used within max_age_days"""
+        cutoff = time.time() - self.max_age_days * 86400
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith('.json.gz'):
+                    continue
+                file_path = os.path.join(root, name)
+                try:
+                    if os.stat(file_path).st_mtime < cutoff:
+                        os.remove(file_path)
+                except OSError:
+                    continue
+
+
+# Shared instances used across all CSVs processed in this interpreter
+transcript_store = TranscriptStore()
+result_cache = ResultCache()
+result_archive = ResultArchive()
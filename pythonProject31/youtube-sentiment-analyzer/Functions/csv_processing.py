@@ -3,8 +3,51 @@ CSV processing functions for YouTube Sentiment Analyzer
 """
 
 import pandas as pd
-import time
-from .video_processing import extract_video_id, process_single_video
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from .video_processing import extract_video_id, get_video_transcript, process_single_video
+from .caching import result_cache
+from .reporting import create_segment_table
+from .result_store import ResultStore
+from .sentiment_analysis import EMOTION_KEYWORDS
+from .rate_limiting import TokenBucket, get_shared_rate_limiter
+
+
+# Transcript download settings
+MAX_IN_FLIGHT = 4  # Concurrent transcript requests
+REQUESTS_PER_SECOND = 2.0  # Sustained request rate towards YouTube
+
+
+def prefetch_transcripts(video_ids, max_in_flight=MAX_IN_FLIGHT, rate_limiter=None):
+    """
+    Yield transcripts in input order while up to max_in_flight downloads run ahead
+
+    Args:
+        video_ids (list): Video IDs to fetch, in processing order
+        max_in_flight (int): Maximum number of concurrent transcript requests
+        rate_limiter (TokenBucket): Limiter every request must pass (optional)
+
+    Yields:
+        tuple: (transcript_list, full_transcript) for each video ID, in order
+               (None for videos whose analysis is already cached)
+    """
+    def fetch(video_id):
+        # Videos already analyzed for another CSV need no transcript at all
+        if video_id in result_cache:
+            return None
+        return get_video_transcript(video_id, rate_limiter)
+
+    with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+        remaining = iter(video_ids)
+        pending = deque(executor.submit(fetch, video_id)
+                        for _, video_id in zip(range(max_in_flight), remaining))
+
+        while pending:
+            future = pending.popleft()
+            next_video_id = next(remaining, None)
+            if next_video_id is not None:
+                pending.append(executor.submit(fetch, next_video_id))
+            yield future.result()
 
 
 def is_csv_empty(df):
@@ -38,20 +81,35 @@ def is_csv_empty(df):
     return False
 
 
-def load_csv_and_process(csv_file_path, analyze_sentiment_func, analyze_emotions_func):
-    """Load CSV file and process all videos"""
-    try:
-        print(f"📁 Loading CSV file: {csv_file_path}")
-        df = pd.read_csv(csv_file_path)
-        print(f"✅ CSV loaded successfully. Found {len(df)} rows.")
-
-    except Exception as e:
-        print(f"❌ Error loading CSV file: {str(e)}")
-        return False, []
+def load_csv_and_process(csv_file_path, analyze_sentiment_func, analyze_emotions_func,
+                         max_in_flight=MAX_IN_FLIGHT, requests_per_second=REQUESTS_PER_SECOND,
+                         exact_overall_scores=False, df=None, incremental=True):
+    """
+    Load CSV file and process all videos
+
+    Args:
+        incremental (bool): Reuse archived results of earlier runs for unchanged videos
+        df (pd.DataFrame): Already parsed CSV contents (the file is only read when omitted)
+
+    Returns:
+        tuple: (success, ResultStore of the analyzed videos)
+    """
+    results = ResultStore(EMOTION_KEYWORDS)
+    if df is None:
+        try:
+            print(f"📁 Loading CSV file: {csv_file_path}")
+            df = pd.read_csv(csv_file_path)
+            print(f"✅ CSV loaded successfully. Found {len(df)} rows.")
+
+        except Exception as e:
+            print(f"❌ Error loading CSV file: {str(e)}")
+            return False, results
+    else:
+        print(f"📁 Using preloaded CSV data for {csv_file_path} ({len(df)} rows)")
 
     # Check if CSV is empty
     if is_csv_empty(df):
-        return False, []
+        return False, results
 
     # Try to find video ID/URL column
     possible_columns = ['video_id', 'url', 'video_url', 'youtube_url', 'link', 'Video ID', 'URL', 'Video URL']
@@ -67,15 +125,16 @@ def load_csv_and_process(csv_file_path, analyze_sentiment_func, analyze_emotions
     if video_column is None:
         print("❌ Could not find video ID/URL column. Please ensure your CSV has one of these columns:")
         print("   video_id, url, video_url, youtube_url, link, Video ID, URL, Video URL")
-        return False, []
+        return False, results
 
     print(f"🎯 Using column '{video_column}' for video IDs/URLs")
 
     # Process each video
     successful_videos = 0
     failed_videos = 0
-    results = []
 
+    # Resolve video IDs up front so transcripts can be fetched ahead of analysis
+    jobs = []
     for idx, row in df.iterrows():
         video_url_or_id = row[video_column]
 
@@ -87,19 +146,26 @@ def load_csv_and_process(csv_file_path, analyze_sentiment_func, analyze_emotions
             failed_videos += 1
             continue
 
+        jobs.append((idx, row, video_id))
+
+    # Transcripts download concurrently (paced by the token bucket) while the
+    # analysis below consumes them in CSV order. Batch workers share one bucket.
+    rate_limiter = get_shared_rate_limiter() or TokenBucket(requests_per_second)
+    transcripts = prefetch_transcripts([video_id for _, _, video_id in jobs], max_in_flight, rate_limiter)
+
+    for (idx, row, video_id), transcript in zip(jobs, transcripts):
         print(f"🎬 Processing video {idx + 1}/{len(df)}: {video_id}")
 
-        video_result = process_single_video(video_id, idx + 1, row, analyze_sentiment_func, analyze_emotions_func)
-        
+        video_result = process_single_video(video_id, idx + 1, row, analyze_sentiment_func, analyze_emotions_func,
+                                            transcript=transcript, exact_overall_scores=exact_overall_scores,
+                                            incremental=incremental)
+
         if video_result:
-            results.append(video_result)
+            results.add(video_result)
             successful_videos += 1
         else:
             failed_videos += 1
 
-        # Small delay to be respectful to YouTube's servers
-        time.sleep(0.5)
-
     print(f"\n📊 Processing Summary:")
     print(f"   ✅ Successful: {successful_videos}")
     print(f"   ❌ Failed: {failed_videos}")
@@ -112,26 +178,4 @@ def load_csv_and_process(csv_file_path, analyze_sentiment_func, analyze_emotions
 
 def create_sentiment_table(results, emotion_keywords):
     """Create a table showing sentiment and emotion per segment"""
-    all_segments = []
-
-    for result in results:
-        for i, segment in enumerate(result['segments']):
-            segment_data = {
-                'video_id': result['video_id'],
-                'video_url': result['url'],
-                'segment_number': i + 1,
-                'start_time': round(segment['start_time'], 1),
-                'end_time': round(segment['end_time'], 1),
-                'duration': round(segment['end_time'] - segment['start_time'], 1),
-                'sentiment': segment['sentiment'],
-                'polarity': round(segment['polarity'], 3),
-                'subjectivity': round(segment['subjectivity'], 3)
-            }
-
-            # Add emotion scores
-            for emotion in emotion_keywords.keys():
-                segment_data[f'{emotion}_score'] = round(segment.get(emotion, 0), 3)
-
-            all_segments.append(segment_data)
-
-    return pd.DataFrame(all_segments)
\ No newline at end of file
+    return create_segment_table(results, emotion_keywords)
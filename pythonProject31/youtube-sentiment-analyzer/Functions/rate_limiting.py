@@ -0,0 +1,91 @@
+"""
+Rate limiting functions for YouTube Sentiment Analyzer
+"""
+
+import multiprocessing
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket that paces requests to YouTube"""
+
+    def __init__(self, rate, capacity=None):
+        """
+        Initialize the token bucket
+
+        Args:
+            rate (float): Tokens refilled per second (sustained requests per second)
+            capacity (float): Maximum burst size (defaults to one second worth of tokens)
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        """Block until the requested tokens are available, then consume them"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+
+                wait_time = (tokens - self.tokens) / self.rate
+
+            time.sleep(wait_time)
+
+
+class SharedTokenBucket:
+    """Token bucket whose state lives in shared memory, so several processes draw from one request budget"""
+
+    def __init__(self, rate, capacity=None):
+        """
+        Initialize the shared token bucket (create it before starting the worker processes)
+
+        Args:
+            rate (float): Tokens refilled per second, across all processes
+            capacity (float): Maximum burst size (defaults to one second worth of tokens)
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self.lock = multiprocessing.Lock()
+        self.tokens = multiprocessing.Value('d', self.capacity, lock=False)
+        self.last_refill = multiprocessing.Value('d', time.monotonic(), lock=False)
+
+    def acquire(self, tokens=1):
+        """Block until the requested tokens are available, then consume them"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens.value = min(self.capacity,
+                                        self.tokens.value + (now - self.last_refill.value) * self.rate)
+                self.last_refill.value = now
+
+                if self.tokens.value >= tokens:
+                    self.tokens.value -= tokens
+                    return
+
+                wait_time = (tokens - self.tokens.value) / self.rate
+
+            time.sleep(wait_time)
+
+
+# Process-wide limiter installed by batch workers; used instead of a per-CSV bucket when set
+_shared_rate_limiter = None
+
+
+def install_shared_rate_limiter(rate_limiter):
+    """Make every transcript request in this process draw from the given limiter"""
+    global _shared_rate_limiter
+    _shared_rate_limiter = rate_limiter
+
+
+def get_shared_rate_limiter():
+    """Get the process-wide limiter, or None if none was installed"""
+    return _shared_rate_limiter
@@ -3,13 +3,15 @@ Reporting functions for YouTube Sentiment Analyzer
 """
 
 import os
+import numpy as np
 import pandas as pd
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter
+from .result_store import SENTIMENT_LABELS
 
 
 def generate_report(results, csv_file_path, output_folder):
-    """Generate a comprehensive text report"""
+    """Generate a comprehensive text report from a ResultStore"""
     if not results:
         print("❌ No results to report")
         return
@@ -27,16 +29,10 @@ def generate_report(results, csv_file_path, output_folder):
     report_lines.append("OVERALL STATISTICS")
     report_lines.append("-" * 50)
 
-    sentiment_distribution = defaultdict(int)
-    total_segments = 0
-    total_words = 0
-    total_duration = 0
-
-    for result in results:
-        sentiment_distribution[result['overall_sentiment']['sentiment']] += 1
-        total_segments += len(result['segments'])
-        total_words += result['word_count']
-        total_duration += result['video_length']
+    sentiment_distribution = Counter(results.video_sentiments())
+    total_segments = int(results.video_column('total_segments').sum())
+    total_words = int(results.video_column('word_count').sum())
+    total_duration = float(results.video_column('video_length').sum())
 
     report_lines.append(f"Total Segments Analyzed: {total_segments:,}")
     report_lines.append(f"Total Words Processed: {total_words:,}")
@@ -54,10 +50,8 @@ def generate_report(results, csv_file_path, output_folder):
     report_lines.append("EMOTION ANALYSIS")
     report_lines.append("-" * 50)
 
-    emotion_totals = defaultdict(float)
-    for result in results:
-        for emotion, score in result['overall_emotions'].items():
-            emotion_totals[emotion] += score
+    emotion_scores = results.emotion_matrix()
+    emotion_totals = dict(zip(results.emotions, emotion_scores.sum(axis=0)))
 
     sorted_emotions = sorted(emotion_totals.items(), key=lambda x: x[1], reverse=True)
     report_lines.append("Average Emotion Scores (ranked by intensity):")
@@ -70,27 +64,29 @@ def generate_report(results, csv_file_path, output_folder):
     report_lines.append("NOTABLE VIDEOS")
     report_lines.append("-" * 50)
 
+    polarities = results.video_column('polarity')
+
     # Most positive
-    most_positive = max(results, key=lambda x: x['overall_sentiment']['polarity'])
+    most_positive = results.video_ids[int(np.argmax(polarities))]
     report_lines.append(f"Most Positive Video:")
-    report_lines.append(f"  Video ID: {most_positive['video_id']}")
-    report_lines.append(f"  Polarity: {most_positive['overall_sentiment']['polarity']:.3f}")
-    report_lines.append(f"  URL: {most_positive['url']}")
+    report_lines.append(f"  Video ID: {most_positive}")
+    report_lines.append(f"  Polarity: {polarities.max():.3f}")
+    report_lines.append(f"  URL: {results.video_url(most_positive)}")
 
     # Most negative
-    most_negative = min(results, key=lambda x: x['overall_sentiment']['polarity'])
+    most_negative = results.video_ids[int(np.argmin(polarities))]
     report_lines.append(f"\nMost Negative Video:")
-    report_lines.append(f"  Video ID: {most_negative['video_id']}")
-    report_lines.append(f"  Polarity: {most_negative['overall_sentiment']['polarity']:.3f}")
-    report_lines.append(f"  URL: {most_negative['url']}")
+    report_lines.append(f"  Video ID: {most_negative}")
+    report_lines.append(f"  Polarity: {polarities.min():.3f}")
+    report_lines.append(f"  URL: {results.video_url(most_negative)}")
 
     # Most emotional (highest total emotion scores)
-    most_emotional = max(results, key=lambda x: sum(x['overall_emotions'].values()))
-    total_emotion = sum(most_emotional['overall_emotions'].values())
+    emotion_sums = emotion_scores.sum(axis=1)
+    most_emotional = results.video_ids[int(np.argmax(emotion_sums))]
     report_lines.append(f"\nMost Emotional Video:")
-    report_lines.append(f"  Video ID: {most_emotional['video_id']}")
-    report_lines.append(f"  Total Emotion Score: {total_emotion:.2f}")
-    report_lines.append(f"  URL: {most_emotional['url']}")
+    report_lines.append(f"  Video ID: {most_emotional}")
+    report_lines.append(f"  Total Emotion Score: {emotion_sums.max():.2f}")
+    report_lines.append(f"  URL: {results.video_url(most_emotional)}")
 
     # Print and save report
     report_text = "\n".join(report_lines)
@@ -116,28 +112,25 @@ def save_results(results, emotion_keywords, output_folder):
     print(f"💾 Segment analysis saved as: {segment_filename}")
 
     # Save overall video results in output folder
-    overall_results = []
-    for result in results:
-        overall_data = {
-            'row_number': result['row_number'],
-            'video_id': result['video_id'],
-            'url': result['url'],
-            'video_length_seconds': round(result['video_length'], 1),
-            'video_length_minutes': round(result['video_length'] / 60, 1),
-            'total_segments': result['total_segments'],
-            'word_count': result['word_count'],
-            'overall_sentiment': result['overall_sentiment']['sentiment'],
-            'polarity': round(result['overall_sentiment']['polarity'], 3),
-            'subjectivity': round(result['overall_sentiment']['subjectivity'], 3)
-        }
-
-        # Add emotion scores
-        for emotion, score in result['overall_emotions'].items():
-            overall_data[f'{emotion}_score'] = round(score, 3)
-
-        overall_results.append(overall_data)
-
-    overall_df = pd.DataFrame(overall_results)
+    video_length = results.video_column('video_length')
+    overall_data = {
+        'row_number': results.video_column('row_number'),
+        'video_id': results.video_ids,
+        'url': [results.video_url(video_id) for video_id in results.video_ids],
+        'video_length_seconds': np.round(video_length, 1),
+        'video_length_minutes': np.round(video_length / 60, 1),
+        'total_segments': results.video_column('total_segments'),
+        'word_count': results.video_column('word_count'),
+        'overall_sentiment': results.video_sentiments(),
+        'polarity': np.round(results.video_column('polarity'), 3),
+        'subjectivity': np.round(results.video_column('subjectivity'), 3)
+    }
+
+    # Add emotion scores
+    for emotion in results.emotions:
+        overall_data[f'{emotion}_score'] = np.round(results.video_column(emotion), 3)
+
+    overall_df = pd.DataFrame(overall_data)
     overall_filename = os.path.join(output_folder, f'overall_sentiment_results_{timestamp}.csv')
     overall_df.to_csv(overall_filename, index=False)
     print(f"💾 Overall results saved as: {overall_filename}")
@@ -147,26 +140,28 @@ def save_results(results, emotion_keywords, output_folder):
 
 def create_segment_table(results, emotion_keywords):
     """Create a table showing sentiment and emotion per segment"""
-    all_segments = []
-
-    for result in results:
-        for i, segment in enumerate(result['segments']):
-            segment_data = {
-                'video_id': result['video_id'],
-                'video_url': result['url'],
-                'segment_number': i + 1,
-                'start_time': round(segment['start_time'], 1),
-                'end_time': round(segment['end_time'], 1),
-                'duration': round(segment['end_time'] - segment['start_time'], 1),
-                'sentiment': segment['sentiment'],
-                'polarity': round(segment['polarity'], 3),
-                'subjectivity': round(segment['subjectivity'], 3)
-            }
-
-            # Add emotion scores
-            for emotion in emotion_keywords.keys():
-                segment_data[f'{emotion}_score'] = round(segment.get(emotion, 0), 3)
-
-            all_segments.append(segment_data)
-
-    return pd.DataFrame(all_segments)
\ No newline at end of file
+    video_index = results.segment_column('video_index')
+    video_ids = np.asarray(results.video_ids, dtype=object)
+    start_time = results.segment_column('start_time')
+    end_time = results.segment_column('end_time')
+
+    # Number segments from 1 within each video
+    segment_number = np.arange(len(video_index)) - results.video_column('segment_offset')[video_index] + 1
+
+    segment_data = {
+        'video_id': video_ids[video_index],
+        'video_url': [results.video_url(video_id) for video_id in video_ids[video_index]],
+        'segment_number': segment_number,
+        'start_time': np.round(start_time, 1),
+        'end_time': np.round(end_time, 1),
+        'duration': np.round(end_time - start_time, 1),
+        'sentiment': np.asarray(SENTIMENT_LABELS, dtype=object)[results.segment_column('sentiment')],
+        'polarity': np.round(results.segment_column('polarity'), 3),
+        'subjectivity': np.round(results.segment_column('subjectivity'), 3)
+    }
+
+    # Add emotion scores
+    for emotion in emotion_keywords.keys():
+        segment_data[f'{emotion}_score'] = np.round(results.segment_column(emotion), 3)
+
+    return pd.DataFrame(segment_data)
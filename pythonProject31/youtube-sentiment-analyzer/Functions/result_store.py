@@ -0,0 +1,128 @@
+"""
+Result store functions for YouTube Sentiment Analyzer
+"""
+
+from array import array
+import numpy as np
+
+
+# Sentiment labels are stored as small integer codes
+SENTIMENT_LABELS = ('negative', 'neutral', 'positive')
+SENTIMENT_CODES = {label: code for code, label in enumerate(SENTIMENT_LABELS)}
+
+
+def _to_numpy(column):
+    """Copy a typed array into a NumPy array (a view would pin the array against further appends)"""
+    return np.frombuffer(column, dtype=column.typecode).copy() if len(column) else np.array([], dtype=column.typecode)
+
+
+class ResultStore:
+    """
+    Columnar container for analysis results
+
+    Videos and segments live in two tables of typed arrays (one array per
+    column); segment text and the original CSV rows are not kept. Columns are
+    read back as NumPy arrays.
+    """
+
+    def __init__(self, emotions):
+        """
+        Initialize an empty result store
+
+        Args:
+            emotions (iterable): Emotion names scored for every video and segment
+        """
+        self.emotions = list(emotions)
+
+        # Videos table
+        self.video_ids = []
+        self.video_columns = {
+            'row_number': array('q'),
+            'sentiment': array('b'),
+            'polarity': array('d'),
+            'subjectivity': array('d'),
+            'video_length': array('d'),
+            'word_count': array('q'),
+            'total_segments': array('q'),
+            'segment_offset': array('q'),  # Index of the video's first segment
+        }
+        self.video_emotions = {emotion: array('d') for emotion in self.emotions}
+
+        # Segments table
+        self.segment_columns = {
+            'video_index': array('q'),
+            'start_time': array('d'),
+            'end_time': array('d'),
+            'sentiment': array('b'),
+            'polarity': array('d'),
+            'subjectivity': array('d'),
+            'word_count': array('q'),
+        }
+        self.segment_emotions = {emotion: array('d') for emotion in self.emotions}
+
+    def __len__(self):
+        return len(self.video_ids)
+
+    def add(self, video_result):
+        """Append one video result (as returned by process_single_video)"""
+        video_index = len(self.video_ids)
+        segments = video_result['segments']
+
+        self.video_ids.append(video_result['video_id'])
+        columns = self.video_columns
+        columns['row_number'].append(video_result['row_number'])
+        columns['sentiment'].append(SENTIMENT_CODES[video_result['overall_sentiment']['sentiment']])
+        columns['polarity'].append(video_result['overall_sentiment']['polarity'])
+        columns['subjectivity'].append(video_result['overall_sentiment']['subjectivity'])
+        columns['video_length'].append(video_result['video_length'])
+        columns['word_count'].append(video_result['word_count'])
+        columns['total_segments'].append(len(segments))
+        columns['segment_offset'].append(len(self.segment_columns['video_index']))
+        for emotion in self.emotions:
+            self.video_emotions[emotion].append(video_result['overall_emotions'].get(emotion, 0.0))
+
+        columns = self.segment_columns
+        for segment in segments:
+            columns['video_index'].append(video_index)
+            columns['start_time'].append(segment['start_time'])
+            columns['end_time'].append(segment['end_time'])
+            columns['sentiment'].append(SENTIMENT_CODES[segment['sentiment']])
+            columns['polarity'].append(segment['polarity'])
+            columns['subjectivity'].append(segment['subjectivity'])
+            columns['word_count'].append(segment.get('word_count', 0))
+            for emotion in self.emotions:
+                self.segment_emotions[emotion].append(segment.get(emotion, 0.0))
+
+    def video_column(self, name):
+        """Get a videos-table column (or an emotion score) as a NumPy array"""
+        column = self.video_columns.get(name)
+        if column is None:
+            column = self.video_emotions[name]
+        return _to_numpy(column)
+
+    def segment_column(self, name):
+        """Get a segments-table column (or an emotion score) as a NumPy array"""
+        column = self.segment_columns.get(name)
+        if column is None:
+            column = self.segment_emotions[name]
+        return _to_numpy(column)
+
+    def emotion_matrix(self):
+        """Get overall emotion scores as a (videos x emotions) array"""
+        if not self.emotions:
+            return np.empty((len(self), 0))
+        return np.column_stack([self.video_column(emotion) for emotion in self.emotions])
+
+    def video_sentiments(self):
+        """Get overall sentiment labels, one per video"""
+        return [SENTIMENT_LABELS[code] for code in self.video_columns['sentiment']]
+
+    def segment_range(self, video_index):
+        """Get the (first, stop) segment indices belonging to a video"""
+        first = self.video_columns['segment_offset'][video_index]
+        return first, first + self.video_columns['total_segments'][video_index]
+
+    @staticmethod
+    def video_url(video_id):
+        """Build the watch URL for a video ID"""
+        return f"https://www.youtube.com/watch?v={video_id}"
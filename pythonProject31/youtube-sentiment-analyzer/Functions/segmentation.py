@@ -0,0 +1,71 @@
+"""
+Segmentation functions for YouTube Sentiment Analyzer
+"""
+
+import numpy as np
+
+
+# Default segment window (seconds)
+SEGMENT_SIZE = 30
+
+
+def transcript_time_arrays(transcript_list):
+    """
+    Build start/end time arrays for a transcript
+
+    Args:
+        transcript_list (list): Transcript entries with 'start' and optional 'duration'
+
+    Returns:
+        tuple: (starts, ends) float arrays, one value per entry
+    """
+    starts = np.fromiter((entry['start'] for entry in transcript_list), dtype=float, count=len(transcript_list))
+    durations = np.fromiter((entry.get('duration', 0) for entry in transcript_list), dtype=float,
+                            count=len(transcript_list))
+    return starts, starts + durations
+
+
+def segment_ranges(starts, segment_size=SEGMENT_SIZE, step=None):
+    """
+    Split a transcript into segments of entry indices
+
+    Without a step, segments are consecutive: each one runs from its first entry
+    up to and including the first entry starting segment_size seconds later (or
+    the last entry). With a step, windows of segment_size seconds start every
+    step seconds and may overlap; empty windows are skipped.
+
+    Args:
+        starts (np.ndarray): Sorted entry start times
+        segment_size (float): Window length in seconds
+        step (float): Seconds between window starts for sliding windows (None for consecutive)
+
+    Returns:
+        tuple: (firsts, stops) int arrays; segment k covers entries firsts[k]:stops[k]
+    """
+    n = len(starts)
+    if n == 0:
+        return np.empty(0, dtype=int), np.empty(0, dtype=int)
+
+    if step is not None:
+        window_starts = np.arange(starts[0], starts[-1] + step, step)
+        firsts = np.searchsorted(starts, window_starts, side='left')
+        stops = np.searchsorted(starts, window_starts + segment_size, side='left')
+        non_empty = stops > firsts
+        return firsts[non_empty], stops[non_empty]
+
+    # Consecutive segments are greedy, so walk segment by segment (not entry by entry)
+    firsts = []
+    stops = []
+    first = 0
+    while first < n:
+        last = min(int(np.searchsorted(starts, starts[first] + segment_size, side='left')), n - 1)
+        firsts.append(first)
+        stops.append(last + 1)
+        first = last + 1
+
+    return np.asarray(firsts, dtype=int), np.asarray(stops, dtype=int)
+
+
+def segment_text(transcript_list, first, stop):
+    """Join the text of the transcript entries first:stop"""
+    return ' '.join(transcript_list[i]['text'] for i in range(first, stop))
@@ -2,6 +2,11 @@
 Sentiment and emotion analysis functions for YouTube Sentiment Analyzer
 """
 
+import atexit
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from textblob import TextBlob
 
 
@@ -19,26 +24,89 @@ EMOTION_KEYWORDS = {
 }
 
 
+class EmotionMatcher:
+    """Emotion keyword matcher compiled once into a single word-boundary regex"""
+
+    def __init__(self, emotion_keywords):
+        """
+        Build the matcher
+
+        Args:
+            emotion_keywords (dict): Emotion name -> list of keywords
+        """
+        self.emotions = list(emotion_keywords.keys())
+
+        # A keyword may belong to several emotions (e.g. 'excited')
+        self.keyword_emotions = {}
+        for emotion, keywords in emotion_keywords.items():
+            for keyword in keywords:
+                self.keyword_emotions.setdefault(keyword.lower(), []).append(emotion)
+
+        # Longest keywords first so the alternation never stops at a shorter prefix
+        alternation = '|'.join(re.escape(keyword)
+                               for keyword in sorted(self.keyword_emotions, key=len, reverse=True))
+        self.pattern = re.compile(rf"\b(?:{alternation})\b")
+
+    def count(self, text):
+        """
+        Count keyword hits for every emotion in one pass over the text
+
+        Returns:
+            tuple: (hits per emotion dict, word count)
+        """
+        hits = dict.fromkeys(self.emotions, 0)
+        if not text:
+            return hits, 0
+
+        for match in self.pattern.finditer(text.lower()):
+            for emotion in self.keyword_emotions[match.group()]:
+                hits[emotion] += 1
+
+        return hits, len(text.split())
+
+    def score(self, text):
+        """Get keyword hits per 1000 words for every emotion"""
+        hits, word_count = self.count(text)
+        if word_count == 0:
+            return {emotion: 0.0 for emotion in self.emotions}
+        return {emotion: (hit_count / word_count) * 1000 for emotion, hit_count in hits.items()}
+
+
+EMOTION_MATCHER = EmotionMatcher(EMOTION_KEYWORDS)
+
+# Batched segment scoring settings
+SCORING_WORKERS = os.cpu_count() or 1  # Worker processes for segment scoring
+SCORING_CHUNK_SIZE = 32  # Segments sent to a worker per task
+PROCESS_POOL_MIN_SEGMENTS = 64  # Smaller batches are scored in-process
+
+_scoring_pool = None
+
+
+def classify_polarity(polarity):
+    """Map a polarity score to a sentiment label"""
+    if polarity > 0.1:
+        return 'positive'
+    elif polarity < -0.1:
+        return 'negative'
+    return 'neutral'
+
+
 def analyze_sentiment(text):
     """Analyze sentiment using TextBlob"""
     if not text or text.strip() == '':
-        return {'sentiment': 'neutral', 'polarity': 0.0, 'subjectivity': 0.0}
+        return {'sentiment': 'neutral', 'polarity': 0.0, 'subjectivity': 0.0, 'assessment_count': 0}
 
     blob = TextBlob(text)
-    polarity = blob.polarity  # -1 (negative) to 1 (positive)
-    subjectivity = blob.subjectivity  # 0 (objective) to 1 (subjective)
-
-    if polarity > 0.1:
-        sentiment = 'positive'
-    elif polarity < -0.1:
-        sentiment = 'negative'
-    else:
-        sentiment = 'neutral'
+    sentiment_assessments = blob.sentiment_assessments
+    polarity = sentiment_assessments.polarity  # -1 (negative) to 1 (positive)
+    subjectivity = sentiment_assessments.subjectivity  # 0 (objective) to 1 (subjective)
 
     return {
-        'sentiment': sentiment,
+        'sentiment': classify_polarity(polarity),
         'polarity': polarity,
-        'subjectivity': subjectivity
+        'subjectivity': subjectivity,
+        # Number of scored words/phrases the averages above are taken over
+        'assessment_count': len(sentiment_assessments.assessments)
     }
 
 
@@ -47,16 +115,111 @@ def analyze_emotions(text):
     if not text or text.strip() == '':
         return {emotion: 0.0 for emotion in EMOTION_KEYWORDS.keys()}
 
-    text_lower = text.lower()
-    emotion_scores = {}
+    # Whole-word keyword hits, normalized by text length (per 1000 words)
+    return EMOTION_MATCHER.score(text)
+
+
+def aggregate_segment_scores(segments, emotions):
+    """
+    Derive whole-video sentiment and emotion scores from per-segment statistics
 
-    for emotion, keywords in EMOTION_KEYWORDS.items():
-        score = sum(text_lower.count(keyword) for keyword in keywords)
-        # Normalize by text length (per 1000 words)
-        word_count = len(text.split())
-        if word_count > 0:
-            emotion_scores[emotion] = (score / word_count) * 1000
+    TextBlob polarity/subjectivity are means over the text's assessments, so the
+    video score is the assessment-weighted mean of the segment scores. Emotion
+    scores are hits per 1000 words, so the video score is the word-weighted mean.
+
+    Args:
+        segments (list): Segment dicts from analyze_video_segments
+        emotions (iterable): Emotion names to aggregate
+
+    Returns:
+        tuple: (overall_sentiment, overall_emotions)
+    """
+    total_weight = sum(segment['sentiment_weight'] for segment in segments)
+    total_words = sum(segment['word_count'] for segment in segments)
+
+    if total_weight > 0:
+        polarity = sum(segment['polarity'] * segment['sentiment_weight'] for segment in segments) / total_weight
+        subjectivity = sum(segment['subjectivity'] * segment['sentiment_weight'] for segment in segments) / total_weight
+    else:
+        polarity = 0.0
+        subjectivity = 0.0
+
+    overall_sentiment = {
+        'sentiment': classify_polarity(polarity),
+        'polarity': polarity,
+        'subjectivity': subjectivity
+    }
+
+    overall_emotions = {}
+    for emotion in emotions:
+        if total_words > 0:
+            overall_emotions[emotion] = sum(segment[emotion] * segment['word_count'] for segment in segments) / total_words
         else:
-            emotion_scores[emotion] = 0.0
+            overall_emotions[emotion] = 0.0
+
+    return overall_sentiment, overall_emotions
+
+
+def _warm_scoring_worker():
+    """Load TextBlob's analyzer once when a worker starts"""
+    TextBlob("warm up").sentiment
+
+
+def _score_chunk(texts, analyze_sentiment_func, analyze_emotions_func):
+    """Score a list of texts, returning (sentiment, emotions) pairs in order"""
+    return [(analyze_sentiment_func(text), analyze_emotions_func(text)) for text in texts]
+
+
+def get_scoring_pool(max_workers=None):
+    """Get the shared, pre-warmed process pool used for segment scoring"""
+    global _scoring_pool
+    if _scoring_pool is None:
+        _scoring_pool = ProcessPoolExecutor(max_workers=max_workers or SCORING_WORKERS,
+                                            initializer=_warm_scoring_worker)
+        atexit.register(shutdown_scoring_pool)
+    return _scoring_pool
+
+
+def shutdown_scoring_pool():
+    """Shut down the segment scoring pool if it was started"""
+    global _scoring_pool
+    if _scoring_pool is not None:
+        _scoring_pool.shutdown()
+        _scoring_pool = None
+
+
+def score_segments(texts, analyze_sentiment_func=analyze_sentiment, analyze_emotions_func=analyze_emotions,
+                   max_workers=None, chunk_size=SCORING_CHUNK_SIZE):
+    """
+    Score segment texts with sentiment and emotion analysis
+
+    Large batches are split into chunks and fanned out across a process pool;
+    results always come back in the same order as the input texts.
+
+    Args:
+        texts (list): Segment texts to score
+        analyze_sentiment_func (callable): Sentiment function (must be picklable for the pool)
+        analyze_emotions_func (callable): Emotion function (must be picklable for the pool)
+        max_workers (int): Worker processes (defaults to SCORING_WORKERS)
+        chunk_size (int): Segments per worker task
+
+    Returns:
+        list: (sentiment_analysis, emotion_analysis) tuple per text
+    """
+    if len(texts) < PROCESS_POOL_MIN_SEGMENTS or (max_workers or SCORING_WORKERS) < 2:
+        return _score_chunk(texts, analyze_sentiment_func, analyze_emotions_func)
+
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+
+    try:
+        pool = get_scoring_pool(max_workers)
+        scored = []
+        for chunk_scores in pool.map(_score_chunk, chunks, repeat(analyze_sentiment_func),
+                                     repeat(analyze_emotions_func)):
+            scored.extend(chunk_scores)
+        return scored
 
-    return emotion_scores
\ No newline at end of file
+    except Exception as e:
+        print(f"  ⚠️  Process pool scoring failed ({str(e)}), scoring in-process instead")
+        shutdown_scoring_pool()
+        return _score_chunk(texts, analyze_sentiment_func, analyze_emotions_func)
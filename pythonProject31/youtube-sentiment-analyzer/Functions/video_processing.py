@@ -5,7 +5,18 @@ Video processing functions for YouTube Sentiment Analyzer
 import pandas as pd
 import re
 import time
+import numpy as np
 from youtube_transcript_api import YouTubeTranscriptApi
+from .caching import transcript_store, result_cache, result_archive, transcript_hash, ANALYZER_VERSION
+from .segmentation import SEGMENT_SIZE, transcript_time_arrays, segment_ranges, segment_text
+from .sentiment_analysis import EMOTION_KEYWORDS, score_segments, aggregate_segment_scores
+
+
+# Score the full transcript again for overall results instead of deriving them from segments
+EXACT_OVERALL_SCORES = False
+
+# Reuse results archived by earlier runs for videos whose transcript has not changed
+INCREMENTAL_RESULTS = True
 
 
 def extract_video_id(url):
@@ -29,10 +40,20 @@ def extract_video_id(url):
     return None
 
 
-def get_video_transcript(video_id):
-    """Get transcript for a YouTube video"""
+def get_video_transcript(video_id, rate_limiter=None):
+    """
+    Get transcript for a YouTube video
+
+    Transcripts are served from the shared on-disk store when available; only
+    misses go to YouTube (and only those wait on the rate limiter).
+    """
     try:
-        transcript_list = YouTubeTranscriptApi.get_transcript(video_id)
+        transcript_list = transcript_store.get(video_id)
+        if transcript_list is None:
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+            transcript_list = YouTubeTranscriptApi.get_transcript(video_id)
+            transcript_store.put(video_id, transcript_list)
         full_transcript = ' '.join([entry['text'] for entry in transcript_list])
         return transcript_list, full_transcript
     except Exception as e:
@@ -40,59 +61,99 @@ def get_video_transcript(video_id):
         return None, None
 
 
-def analyze_video_segments(transcript_list, analyze_sentiment_func, analyze_emotions_func):
-    """Analyze sentiment and emotions for video segments"""
+def analyze_video_segments(transcript_list, analyze_sentiment_func, analyze_emotions_func,
+                           segment_size=SEGMENT_SIZE, step=None):
+    """
+    Analyze sentiment and emotions for video segments
+
+    Args:
+        segment_size (float): Segment window length in seconds
+        step (float): Seconds between window starts for overlapping windows (None for consecutive segments)
+    """
     if not transcript_list:
         return []
 
-    segment_size = 30  # seconds
-    segments = []
-    current_segment = []
-    current_start = 0
-
-    for entry in transcript_list:
-        if not current_segment:
-            current_start = entry['start']
-
-        current_segment.append(entry['text'])
+    starts, ends = transcript_time_arrays(transcript_list)
+    if np.any(np.diff(starts) < 0):
+        order = np.argsort(starts, kind='stable')
+        transcript_list = [transcript_list[i] for i in order]
+        starts, ends = starts[order], ends[order]
 
-        # Create segment every 30 seconds or at end
-        if entry['start'] - current_start >= segment_size or entry == transcript_list[-1]:
-            segment_text = ' '.join(current_segment)
-            sentiment_analysis = analyze_sentiment_func(segment_text)
-            emotion_analysis = analyze_emotions_func(segment_text)
+    firsts, stops = segment_ranges(starts, segment_size, step)
+    boundaries = [(float(starts[first]), float(ends[stop - 1]), segment_text(transcript_list, first, stop))
+                  for first, stop in zip(firsts, stops)]
 
-            segments.append({
-                'start_time': current_start,
-                'end_time': entry['start'] + entry.get('duration', 0),
-                'text': segment_text,
-                'sentiment': sentiment_analysis['sentiment'],
-                'polarity': sentiment_analysis['polarity'],
-                'subjectivity': sentiment_analysis['subjectivity'],
-                **emotion_analysis
-            })
+    # Score all segments in one batch (fanned out over worker processes for long videos)
+    scores = score_segments([text for _, _, text in boundaries], analyze_sentiment_func, analyze_emotions_func)
 
-            current_segment = []
+    segments = []
+    for (start_time, end_time, text), (sentiment_analysis, emotion_analysis) in zip(boundaries, scores):
+        word_count = len(text.split())
+        segments.append({
+            'start_time': start_time,
+            'end_time': end_time,
+            'sentiment': sentiment_analysis['sentiment'],
+            'polarity': sentiment_analysis['polarity'],
+            'subjectivity': sentiment_analysis['subjectivity'],
+            # Sufficient statistics for deriving the overall video scores
+            'word_count': word_count,
+            'sentiment_weight': sentiment_analysis.get('assessment_count', word_count),
+            **emotion_analysis
+        })
 
     return segments
 
 
-def process_single_video(video_id, row_number, row_data, analyze_sentiment_func, analyze_emotions_func):
-    """Process a single video"""
+def process_single_video(video_id, row_number, row_data, analyze_sentiment_func, analyze_emotions_func,
+                         transcript=None, exact_overall_scores=EXACT_OVERALL_SCORES,
+                         incremental=INCREMENTAL_RESULTS):
+    """
+    Process a single video
+
+    Args:
+        transcript (tuple): Pre-fetched (transcript_list, full_transcript); fetched here if omitted
+        exact_overall_scores (bool): Score the full transcript for the overall results instead of
+                                     aggregating the segment scores
+        incremental (bool): Reuse the archived result of an earlier run when the transcript is unchanged
+    """
     try:
+        # Reuse the analysis if this video was already processed for another CSV
+        cached_result = result_cache.get(video_id)
+        if cached_result is not None:
+            print(f"  ♻️  Reused cached analysis. Sentiment: {cached_result['overall_sentiment']['sentiment'].upper()}, "
+                  f"Segments: {cached_result['total_segments']}")
+            return {**cached_result, 'row_number': row_number}
+
         # Get transcript
-        transcript_list, full_transcript = get_video_transcript(video_id)
+        if transcript is None:
+            transcript = get_video_transcript(video_id)
+        transcript_list, full_transcript = transcript
 
         if not full_transcript:
             return None
 
-        # Overall analysis
-        overall_sentiment = analyze_sentiment_func(full_transcript)
-        overall_emotions = analyze_emotions_func(full_transcript)
+        # Reuse the result of an earlier run if neither the transcript nor the analysis changed
+        content_hash = transcript_hash(transcript_list)
+        version = f"{ANALYZER_VERSION}.{SEGMENT_SIZE}{'.exact' if exact_overall_scores else ''}"
+        if incremental:
+            archived_result = result_archive.get(video_id, content_hash, version)
+            if archived_result is not None:
+                result_cache.put(video_id, archived_result)
+                print(f"  ♻️  Reused archived analysis. Sentiment: "
+                      f"{archived_result['overall_sentiment']['sentiment'].upper()}, "
+                      f"Segments: {archived_result['total_segments']}")
+                return {**archived_result, 'row_number': row_number}
 
         # Segment analysis
         segments = analyze_video_segments(transcript_list, analyze_sentiment_func, analyze_emotions_func)
 
+        # Overall analysis
+        if exact_overall_scores:
+            overall_sentiment = analyze_sentiment_func(full_transcript)
+            overall_emotions = analyze_emotions_func(full_transcript)
+        else:
+            overall_sentiment, overall_emotions = aggregate_segment_scores(segments, EMOTION_KEYWORDS.keys())
+
         # Store results
         video_result = {
             'row_number': row_number,
@@ -103,10 +164,14 @@ def process_single_video(video_id, row_number, row_data, analyze_sentiment_func,
             'segments': segments,
             'total_segments': len(segments),
             'video_length': max([s['end_time'] for s in segments]) if segments else 0,
-            'word_count': len(full_transcript.split()),
-            'original_row_data': dict(row_data)  # Store original CSV data
+            'word_count': len(full_transcript.split())
         }
 
+        # Cache and archive everything except the CSV-specific row number
+        cached_result = {key: value for key, value in video_result.items() if key != 'row_number'}
+        result_cache.put(video_id, cached_result)
+        result_archive.put(video_id, content_hash, version, cached_result)
+
         print(f"  ✅ Success! Sentiment: {overall_sentiment['sentiment'].upper()}, Segments: {len(segments)}")
         return video_result
 
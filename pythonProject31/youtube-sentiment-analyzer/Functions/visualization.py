@@ -2,46 +2,118 @@
 Visualization functions for YouTube Sentiment Analyzer
 """
 
+import atexit
+import matplotlib
 import matplotlib.pyplot as plt
 import seaborn as sns
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter
 import numpy as np
 import os
 
 
-def create_visualizations(results, emotion_keywords, output_folder):
-    """Create comprehensive visualizations"""
-    if not results:
-        print("❌ No results to visualize")
-        return
+# Rendering settings (a 20x16 inch figure: 6000x4800 pixels at 300 dpi)
+VISUALIZATION_DPI = 300
+VISUALIZATION_FORMAT = 'png'
+RENDER_IN_BACKGROUND = True  # Render in a worker process while reports and CSVs are written
+PANEL_FORMAT_VERSION = 1  # Bump when the arrays in the .npz panel sidecar change
 
-    print("📊 Creating visualizations...")
+_render_pool = None
+
+
+def collect_panel_data(results, emotion_keywords):
+    """
+    Extract the arrays plotted by the dashboard from a ResultStore
+
+    The panel data is small and picklable, so it can be rendered in another process.
+
+    Returns:
+        dict: Panel name -> numpy array
+    """
+    emotions = list(emotion_keywords.keys())
+    emotion_columns = [results.emotions.index(emotion) for emotion in emotions]
+    emotion_scores = results.emotion_matrix()
+    sentiments = results.video_sentiments()
+    sentiment_counts = Counter(sentiments)
+
+    # Sentiment timelines of the first 5 videos, concatenated with offsets
+    segment_starts = results.segment_column('start_time')
+    segment_polarities = results.segment_column('polarity')
+    timeline_ranges = [(i, *results.segment_range(i)) for i in range(min(5, len(results)))]
+    timeline_ranges = [(i, first, stop) for i, first, stop in timeline_ranges if stop > first]
+
+    # Emotions ranked by their average score
+    emotion_averages = emotion_scores.sum(axis=0) / len(results)
+    ranking = np.argsort(-emotion_averages, kind='stable')
+
+    n_videos_to_show = min(10, len(results))
+
+    return {
+        'sentiment_labels': np.array(list(sentiment_counts.keys()), dtype=str),
+        'sentiment_counts': np.array(list(sentiment_counts.values()), dtype=np.int64),
+        'sentiments': np.array(sentiments, dtype=str),
+        'polarity': results.video_column('polarity'),
+        'subjectivity': results.video_column('subjectivity'),
+        'video_length': results.video_column('video_length'),
+        'word_count': results.video_column('word_count'),
+        'joy': results.video_column('joy'),
+        'emotions': np.array(emotions, dtype=str),
+        'emotion_averages': emotion_scores[:, emotion_columns].mean(axis=0),
+        'heatmap': emotion_scores[:n_videos_to_show, emotion_columns],
+        'timeline_videos': np.array([i for i, _, _ in timeline_ranges], dtype=np.int64),
+        'timeline_offsets': np.cumsum([0] + [stop - first for _, first, stop in timeline_ranges]).astype(np.int64),
+        'timeline_times': np.concatenate([segment_starts[first:stop] for _, first, stop in timeline_ranges] or [[]]),
+        'timeline_polarity': np.concatenate([segment_polarities[first:stop]
+                                             for _, first, stop in timeline_ranges] or [[]]),
+        'ranked_emotions': np.array([results.emotions[i] for i in ranking], dtype=str),
+        'ranked_scores': emotion_averages[ranking]
+    }
+
+
+def render_visualizations(panels, output_filename, dpi=VISUALIZATION_DPI, image_format=VISUALIZATION_FORMAT):
+    """
+    Render the 9-panel dashboard to a file with the Agg backend
+
+    The figure is closed after saving and never shown.
+
+    Args:
+        panels (dict): Panel data from collect_panel_data
+        output_filename (str): Image file to write
+        dpi (int): Output resolution
+        image_format (str): Image format understood by matplotlib (png, jpg, svg, pdf)
+
+    Returns:
+        str: The output file name
+    """
+    # Headless rendering only (no-op if Agg is already active)
+    plt.switch_backend('Agg')
 
     # Set up the plotting style
     plt.style.use('default')
     sns.set_palette("husl")
 
+    sentiments = [str(sentiment) for sentiment in panels['sentiments']]
+    polarities = panels['polarity']
+    color_map = {'positive': 'green', 'negative': 'red', 'neutral': 'gray'}
+
     # Create a large figure with multiple subplots
     fig = plt.figure(figsize=(20, 16))
 
     # 1. Overall Sentiment Distribution
     plt.subplot(3, 3, 1)
-    sentiment_counts = defaultdict(int)
-    for result in results:
-        sentiment_counts[result['overall_sentiment']['sentiment']] += 1
+    sentiment_labels = [str(label) for label in panels['sentiment_labels']]
 
     colors = {'positive': 'green', 'negative': 'red', 'neutral': 'gray'}
-    pie_colors = [colors.get(sentiment, 'blue') for sentiment in sentiment_counts.keys()]
+    pie_colors = [colors.get(sentiment, 'blue') for sentiment in sentiment_labels]
 
-    plt.pie(sentiment_counts.values(), labels=sentiment_counts.keys(),
+    plt.pie(panels['sentiment_counts'], labels=sentiment_labels,
             autopct='%1.1f%%', colors=pie_colors)
     plt.title('Overall Sentiment Distribution\nAcross All Videos')
 
     # 2. Sentiment Polarity Distribution
     plt.subplot(3, 3, 2)
-    all_polarities = [result['overall_sentiment']['polarity'] for result in results]
-    plt.hist(all_polarities, bins=15, alpha=0.7, color='skyblue', edgecolor='black')
+    plt.hist(polarities, bins=15, alpha=0.7, color='skyblue', edgecolor='black')
     plt.axvline(x=0, color='red', linestyle='--', alpha=0.7, label='Neutral')
     plt.xlabel('Sentiment Polarity')
     plt.ylabel('Number of Videos')
@@ -51,14 +123,8 @@ def create_visualizations(results, emotion_keywords, output_folder):
 
     # 3. Average Emotion Scores
     plt.subplot(3, 3, 3)
-    emotion_averages = defaultdict(list)
-
-    for result in results:
-        for emotion in emotion_keywords.keys():
-            emotion_averages[emotion].append(result['overall_emotions'][emotion])
-
-    emotions = list(emotion_averages.keys())
-    avg_scores = [np.mean(emotion_averages[emotion]) for emotion in emotions]
+    emotions = [str(emotion) for emotion in panels['emotions']]
+    avg_scores = list(panels['emotion_averages'])
 
     bars = plt.bar(emotions, avg_scores, alpha=0.8)
     plt.title('Average Emotion Scores\nAcross All Videos')
@@ -76,11 +142,7 @@ def create_visualizations(results, emotion_keywords, output_folder):
 
     # 4. Video Length vs Sentiment
     plt.subplot(3, 3, 4)
-    video_lengths = [result['video_length'] / 60 for result in results]  # Convert to minutes
-    polarities = [result['overall_sentiment']['polarity'] for result in results]
-    sentiments = [result['overall_sentiment']['sentiment'] for result in results]
-
-    color_map = {'positive': 'green', 'negative': 'red', 'neutral': 'gray'}
+    video_lengths = panels['video_length'] / 60  # Convert to minutes
     colors = [color_map[sentiment] for sentiment in sentiments]
 
     plt.scatter(video_lengths, polarities, c=colors, alpha=0.7, s=60)
@@ -96,16 +158,11 @@ def create_visualizations(results, emotion_keywords, output_folder):
 
     # 5. Emotion Heatmap (Top videos)
     plt.subplot(3, 3, 5)
-    n_videos_to_show = min(10, len(results))
-    emotion_matrix = []
-    video_labels = []
-
-    for i, result in enumerate(results[:n_videos_to_show]):
-        video_labels.append(f"Video {i + 1}")
-        emotion_row = [result['overall_emotions'][emotion] for emotion in emotions]
-        emotion_matrix.append(emotion_row)
+    emotion_matrix = panels['heatmap']
+    n_videos_to_show = len(emotion_matrix)
+    video_labels = [f"Video {i + 1}" for i in range(n_videos_to_show)]
 
-    if emotion_matrix:
+    if len(emotion_matrix):
         sns.heatmap(emotion_matrix,
                     xticklabels=emotions,
                     yticklabels=video_labels,
@@ -118,13 +175,13 @@ def create_visualizations(results, emotion_keywords, output_folder):
 
     # 6. Sentiment Timeline (Sample videos)
     plt.subplot(3, 3, 6)
-    sample_videos = results[:5]  # Show first 5 videos
+    offsets = panels['timeline_offsets']
 
-    for i, result in enumerate(sample_videos):
-        if result['segments']:
-            times = [s['start_time'] / 60 for s in result['segments']]  # Convert to minutes
-            polarities = [s['polarity'] for s in result['segments']]
-            plt.plot(times, polarities, label=f"Video {i + 1}", marker='o', markersize=4, alpha=0.7)
+    for n, i in enumerate(panels['timeline_videos']):  # First 5 videos with segments
+        first, stop = offsets[n], offsets[n + 1]
+        times = panels['timeline_times'][first:stop] / 60  # Convert to minutes
+        plt.plot(times, panels['timeline_polarity'][first:stop], label=f"Video {i + 1}", marker='o', markersize=4,
+                 alpha=0.7)
 
     plt.xlabel('Time (minutes)')
     plt.ylabel('Sentiment Polarity')
@@ -134,8 +191,8 @@ def create_visualizations(results, emotion_keywords, output_folder):
 
     # 7. Word Count vs Emotions
     plt.subplot(3, 3, 7)
-    word_counts = [result['word_count'] for result in results]
-    joy_scores = [result['overall_emotions']['joy'] for result in results]
+    word_counts = panels['word_count']
+    joy_scores = panels['joy']
 
     plt.scatter(word_counts, joy_scores, alpha=0.6, s=60, color='gold')
     plt.xlabel('Word Count')
@@ -145,17 +202,7 @@ def create_visualizations(results, emotion_keywords, output_folder):
 
     # 8. Subjectivity vs Polarity
     plt.subplot(3, 3, 8)
-    all_polarities = []
-    all_subjectivities = []
-    all_sentiments = []
-
-    for result in results:
-        all_polarities.append(result['overall_sentiment']['polarity'])
-        all_subjectivities.append(result['overall_sentiment']['subjectivity'])
-        all_sentiments.append(result['overall_sentiment']['sentiment'])
-
-    colors = [color_map[sentiment] for sentiment in all_sentiments]
-    plt.scatter(all_polarities, all_subjectivities, c=colors, alpha=0.7, s=60)
+    plt.scatter(polarities, panels['subjectivity'], c=colors, alpha=0.7, s=60)
     plt.xlabel('Sentiment Polarity')
     plt.ylabel('Subjectivity')
     plt.title('Sentiment vs Subjectivity')
@@ -163,14 +210,8 @@ def create_visualizations(results, emotion_keywords, output_folder):
 
     # 9. Top Emotions Bar Chart
     plt.subplot(3, 3, 9)
-    emotion_totals = defaultdict(float)
-    for result in results:
-        for emotion, score in result['overall_emotions'].items():
-            emotion_totals[emotion] += score
-
-    sorted_emotions = sorted(emotion_totals.items(), key=lambda x: x[1], reverse=True)
-    emotions_sorted = [item[0] for item in sorted_emotions]
-    scores_sorted = [item[1] / len(results) for item in sorted_emotions]  # Average
+    emotions_sorted = [str(emotion) for emotion in panels['ranked_emotions']]
+    scores_sorted = list(panels['ranked_scores'])  # Average
 
     bars = plt.bar(emotions_sorted, scores_sorted, alpha=0.8)
     plt.title('Average Emotion Scores\n(Ranked)')
@@ -186,10 +227,105 @@ def create_visualizations(results, emotion_keywords, output_folder):
 
     plt.tight_layout()
 
-    # Save the plot in output folder
-    output_filename = os.path.join(output_folder, f'youtube_sentiment_analysis_{datetime.now().strftime("%Y%m%d_%H%M%S")}.png')
-    plt.savefig(output_filename, dpi=300, bbox_inches='tight')
+    # Save the plot and release the figure
+    try:
+        fig.savefig(output_filename, dpi=dpi, format=image_format, bbox_inches='tight')
+    finally:
+        plt.close(fig)
+
+    return output_filename
+
+
+def save_panel_data(panels, output_filename):
+    """
+    Write the arrays behind the dashboard panels next to the image
+
+    Project 32 averages these sidecars across analyses instead of decoding the images.
+
+    Returns:
+        str: The .npz file name (None if it could not be written)
+    """
+    sidecar_filename = f"{os.path.splitext(output_filename)[0]}.npz"
+    try:
+        np.savez_compressed(sidecar_filename, panel_format=np.array(PANEL_FORMAT_VERSION), **panels)
+    except OSError as e:
+        print(f"  ⚠️  Could not save panel data: {str(e)}")
+        return None
+    return sidecar_filename
+
+
+def visualization_filename(output_folder, image_format=VISUALIZATION_FORMAT):
+    """Build the timestamped dashboard file name inside the output folder"""
+    return os.path.join(output_folder,
+                        f'youtube_sentiment_analysis_{datetime.now().strftime("%Y%m%d_%H%M%S")}.{image_format}')
+
+
+def create_visualizations(results, emotion_keywords, output_folder, dpi=VISUALIZATION_DPI,
+                          image_format=VISUALIZATION_FORMAT):
+    """Create comprehensive visualizations from a ResultStore"""
+    if not results:
+        print("❌ No results to visualize")
+        return
+
+    print("📊 Creating visualizations...")
+    panels = collect_panel_data(results, emotion_keywords)
+    output_filename = visualization_filename(output_folder, image_format)
+    save_panel_data(panels, output_filename)
+    output_filename = render_visualizations(panels, output_filename, dpi, image_format)
     print(f"📊 Visualization saved as: {output_filename}")
-    plt.show()
 
-    return output_filename
\ No newline at end of file
+    return output_filename
+
+
+def _init_render_worker():
+    """Render workers never need an interactive backend"""
+    matplotlib.use('Agg')
+
+
+def get_render_pool():
+    """Get the shared single-process pool used for background rendering"""
+    global _render_pool
+    if _render_pool is None:
+        _render_pool = ProcessPoolExecutor(max_workers=1, initializer=_init_render_worker)
+        atexit.register(shutdown_render_pool)
+    return _render_pool
+
+
+def shutdown_render_pool():
+    """Shut down the render pool if it was started"""
+    global _render_pool
+    if _render_pool is not None:
+        _render_pool.shutdown()
+        _render_pool = None
+
+
+def start_visualizations(results, emotion_keywords, output_folder, dpi=VISUALIZATION_DPI,
+                         image_format=VISUALIZATION_FORMAT):
+    """
+    Start rendering the visualizations in a background worker process
+
+    The panel data is extracted here; the worker only draws and saves the figure,
+    so the caller can write reports and CSVs meanwhile.
+
+    Returns:
+        Future: Resolves to the output file name (None if there was nothing to plot)
+    """
+    if not results:
+        print("❌ No results to visualize")
+        future = Future()
+        future.set_result(None)
+        return future
+
+    print("📊 Rendering visualizations in the background...")
+    panels = collect_panel_data(results, emotion_keywords)
+    output_filename = visualization_filename(output_folder, image_format)
+    save_panel_data(panels, output_filename)
+
+    try:
+        return get_render_pool().submit(render_visualizations, panels, output_filename, dpi, image_format)
+    except Exception as e:
+        print(f"  ⚠️  Background rendering unavailable ({str(e)}), rendering in-process instead")
+        shutdown_render_pool()
+        future = Future()
+        future.set_result(render_visualizations(panels, output_filename, dpi, image_format))
+        return future
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 CSV Batch Processor for YouTube Sentiment Analysis
-Direct import method - processes multiple CSV files sequentially
+Direct import method - processes multiple CSV files sequentially or in parallel worker processes
 """
 
 import os
@@ -11,25 +11,43 @@ import time
 from pathlib import Path
 from datetime import datetime
 import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # Import the analyzer class directly
 from Functions.analyzer import YouTubeSentimentAnalyzer
+from Functions.csv_processing import REQUESTS_PER_SECOND
+from Functions.rate_limiting import SharedTokenBucket, install_shared_rate_limiter
+from Functions import sentiment_analysis
+
+
+def init_batch_worker(rate_limiter, scoring_workers):
+    """Set up a batch worker process: shared request budget, headless plotting, CPU share"""
+    import matplotlib
+    matplotlib.use('Agg')
+
+    install_shared_rate_limiter(rate_limiter)
+    sentiment_analysis.SCORING_WORKERS = scoring_workers
 
 
 class DirectBatchProcessor:
     """Direct import approach that imports and runs the analyzer directly"""
     
-    def __init__(self, csv_directory, output_base_folder=None, delay_between_files=5):
+    def __init__(self, csv_directory, output_base_folder=None, delay_between_files=5, workers=1,
+                 requests_per_second=REQUESTS_PER_SECOND):
         """
         Initialize the batch processor
         
         Args:
             csv_directory (str): Directory containing CSV files
             output_base_folder (str): Base folder for all outputs (optional)
-            delay_between_files (int): Seconds to wait between processing files
+            delay_between_files (int): Seconds to wait between processing files (sequential mode only)
+            workers (int): Number of CSV files processed concurrently in separate processes
+            requests_per_second (float): Transcript request budget shared by all workers
         """
         self.csv_directory = Path(csv_directory)
         self.delay_between_files = delay_between_files
+        self.workers = max(1, workers)
+        self.requests_per_second = requests_per_second
         self.results_summary = []
         
         # Set up base output folder
@@ -115,8 +133,7 @@ class DirectBatchProcessor:
                     'status': 'success',
                     'duration': duration,
                     'videos_processed': len(analyzer.results),
-                    'output_folder': str(individual_output_folder),
-                    'analyzer_results': analyzer.results
+                    'output_folder': str(individual_output_folder)
                 }
             else:
                 self.logger.error(f"❌ Failed to process {csv_file.name}")
@@ -151,12 +168,26 @@ class DirectBatchProcessor:
             return False
         
         self.logger.info(f"Starting batch processing of {len(csv_files)} files")
-        self.logger.info(f"Delay between files: {self.delay_between_files} seconds")
         self.logger.info(f"Base output folder: {self.output_base_folder}")
         
-        # Process each file
         total_start_time = time.time()
         
+        if self.workers > 1:
+            self.process_csv_files_in_parallel(csv_files)
+        else:
+            self.process_csv_files_sequentially(csv_files)
+        
+        total_end_time = time.time()
+        total_duration = total_end_time - total_start_time
+        
+        # Generate summary report
+        self.generate_summary_report(total_duration)
+        return True
+    
+    def process_csv_files_sequentially(self, csv_files):
+        """Process CSV files one after another with a delay between them"""
+        self.logger.info(f"Delay between files: {self.delay_between_files} seconds")
+        
         for i, csv_file in enumerate(csv_files, 1):
             self.logger.info(f"📊 Processing file {i}/{len(csv_files)}: {csv_file.name}")
             
@@ -167,13 +198,45 @@ class DirectBatchProcessor:
             if i < len(csv_files) and self.delay_between_files > 0:
                 self.logger.info(f"⏳ Waiting {self.delay_between_files} seconds before next file...")
                 time.sleep(self.delay_between_files)
+    
+    def process_csv_files_in_parallel(self, csv_files):
+        """
+        Process CSV files concurrently in worker processes
         
-        total_end_time = time.time()
-        total_duration = total_end_time - total_start_time
+        All workers draw transcript requests from one shared token bucket, so the
+        total request rate stays at requests_per_second however many run at once.
+        Results are merged back in file order regardless of completion order.
+        """
+        workers = min(self.workers, len(csv_files))
+        rate_limiter = SharedTokenBucket(self.requests_per_second)
+        scoring_workers = max(1, (os.cpu_count() or 1) // workers)
         
-        # Generate summary report
-        self.generate_summary_report(total_duration)
-        return True
+        self.logger.info(f"Workers: {workers} (shared budget: {self.requests_per_second} requests/second)")
+        
+        results = [None] * len(csv_files)
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_batch_worker,
+                                 initargs=(rate_limiter, scoring_workers)) as executor:
+            futures = {executor.submit(self.process_single_csv, csv_file): i
+                       for i, csv_file in enumerate(csv_files)}
+            
+            for completed, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    self.logger.error(f"💥 Worker failed on {csv_files[i].name}: {str(e)}")
+                    results[i] = {
+                        'file': csv_files[i].name,
+                        'status': 'error',
+                        'duration': 0.0,
+                        'videos_processed': 0,
+                        'output_folder': None,
+                        'error': str(e)
+                    }
+                self.logger.info(f"📊 Finished file {completed}/{len(csv_files)}: {csv_files[i].name} "
+                                 f"({results[i]['status']})")
+        
+        self.results_summary.extend(results)
     
     def generate_summary_report(self, total_duration):
         """Generate a summary report of all processing results"""
@@ -253,6 +316,7 @@ Examples:
   python batch_processor.py /path/to/csv/files
   python batch_processor.py ./csv_files --delay 10
   python batch_processor.py ./csv_files --output ./batch_results --delay 5
+  python batch_processor.py ./csv_files --workers 4
 
 This script uses the direct import method for better performance and simpler debugging.
         """
@@ -275,6 +339,20 @@ This script uses the direct import method for better performance and simpler deb
         help='Seconds to wait between processing files (default: 5)'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Number of CSV files to process concurrently in separate processes (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--rate',
+        type=float,
+        default=REQUESTS_PER_SECOND,
+        help=f'Transcript requests per second shared by all workers (default: {REQUESTS_PER_SECOND})'
+    )
+    
     args = parser.parse_args()
     
     # Validate CSV directory
@@ -290,7 +368,9 @@ This script uses the direct import method for better performance and simpler deb
     processor = DirectBatchProcessor(
         csv_directory=args.csv_directory,
         output_base_folder=args.output,
-        delay_between_files=args.delay
+        delay_between_files=args.delay,
+        workers=args.workers,
+        requests_per_second=args.rate
     )
     
     success = processor.process_all_csv_files()
@@ -307,6 +387,7 @@ if __name__ == "__main__":
     print("   python batch_processor.py /path/to/csv/directory")
     print("   python batch_processor.py ./csv_files --delay 10")
     print("   python batch_processor.py ./csv_files --output ./results")
+    print("   python batch_processor.py ./csv_files --workers 4")
     print("=" * 60)
     
     main()
\ No newline at end of file
@@ -9,6 +9,7 @@ import os
 
 # Import the main analyzer class from Functions module
 from Functions.analyzer import YouTubeSentimentAnalyzer
+from Functions.visualization import VISUALIZATION_DPI, VISUALIZATION_FORMAT
 
 
 def main():
@@ -37,6 +38,38 @@ Supported column names: video_id, url, video_url, youtube_url, link
         help='Path to output folder (optional - will auto-generate if not provided)'
     )
 
+    parser.add_argument(
+        '--exact-overall',
+        action='store_true',
+        help='Score each full transcript for overall results instead of aggregating segment scores'
+    )
+
+    parser.add_argument(
+        '--full-recompute',
+        action='store_true',
+        help='Analyze every video again instead of reusing results archived by earlier runs'
+    )
+
+    parser.add_argument(
+        '--dpi',
+        type=int,
+        default=VISUALIZATION_DPI,
+        help=f'Resolution of the visualization image (default: {VISUALIZATION_DPI})'
+    )
+
+    parser.add_argument(
+        '--image-format',
+        choices=['png', 'jpg', 'svg', 'pdf'],
+        default=VISUALIZATION_FORMAT,
+        help=f'Format of the visualization image (default: {VISUALIZATION_FORMAT})'
+    )
+
+    parser.add_argument(
+        '--render-in-process',
+        action='store_true',
+        help='Render the visualization in this process instead of a background worker'
+    )
+
     args = parser.parse_args()
 
     # Check if file exists
@@ -45,7 +78,10 @@ Supported column names: video_id, url, video_url, youtube_url, link
         sys.exit(1)
 
     # Create analyzer and run
-    analyzer = YouTubeSentimentAnalyzer(args.csv_file, args.output)
+    analyzer = YouTubeSentimentAnalyzer(args.csv_file, args.output, exact_overall_scores=args.exact_overall,
+                                        incremental=not args.full_recompute, dpi=args.dpi,
+                                        image_format=args.image_format,
+                                        render_in_background=not args.render_in_process)
     success = analyzer.run_analysis()
 
     if not success:
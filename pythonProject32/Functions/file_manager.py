@@ -16,6 +16,7 @@ class FileManager:
     def __init__(self):
         """Initialize the FileManager"""
         self.supported_image_extensions = ['.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.gif']
+        self.panel_extension = '.npz'
         self.supported_text_extensions = ['.txt', '.md', '.text']
     
     def check_input_folder(self, folder_path: str) -> bool:
@@ -112,6 +113,26 @@ class FileManager:
         
         return None
     
+    def find_panel_file(self, folder_path: str) -> Optional[str]:
+        """
+        Find the panel data sidecar (.npz) written next to the 9-graph image
+        
+        Args:
+            folder_path (str): Path to search for the sidecar
+            
+        Returns:
+            Optional[str]: Path to the sidecar if found, None otherwise
+        """
+        try:
+            for file in sorted(os.listdir(folder_path)):
+                file_path = os.path.join(folder_path, file)
+                if os.path.isfile(file_path) and Path(file).suffix.lower() == self.panel_extension:
+                    return file_path
+        except Exception as e:
+            print(f"Error finding panel data in {folder_path}: {str(e)}")
+        
+        return None
+    
     def get_all_files_by_type(self, folder_path: str, file_type: str) -> List[str]:
         """
         Get all files of a specific type from folder and subfolders
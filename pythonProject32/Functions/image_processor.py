@@ -6,10 +6,82 @@ Handles image processing and averaging of 9-graph emotion analysis visualization
 import cv2
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
-from typing import List, Tuple, Optional
+from typing import Iterator, List, Tuple, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import os
 
 
+# OpenCV flags decoding straight at 1/2, 1/4 or 1/8 of the stored resolution
+REDUCED_DECODE_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8
+}
+
+
+class GraphFeatureAccumulator:
+    """
+    Running sums of the features of one graph position, folded in one image at a time
+    """
+    
+    def __init__(self):
+        """Initialize empty sums"""
+        self.count = 0
+        self.region = None
+        self.sums = {}
+    
+    def add(self, features: dict) -> None:
+        """
+        Fold one image's features for this position into the sums
+        
+        Args:
+            features (dict): Features from ImageProcessor.extract_graph_features
+        """
+        values = {
+            'mean_colors': features['mean_colors'],
+            'std_colors': features['std_colors'],
+            'mean_intensity': features['mean_intensity'],
+            'std_intensity': features['std_intensity'],
+            'edge_density': features['edge_density'],
+            'peak_intensity': features['histogram']['peak_intensity'],
+            'hist_spread': features['histogram']['hist_spread']
+        }
+        if self.count == 0:
+            self.region = features['region']  # Use first region as reference
+            self.sums = {key: np.array(value, dtype=np.float64) for key, value in values.items()}
+        else:
+            for key, value in values.items():
+                self.sums[key] += value
+        self.count += 1
+    
+    def average(self) -> dict:
+        """
+        Get the averaged features (same layout as ImageProcessor.average_graph_features)
+        
+        Returns:
+            dict: Averaged features, or an empty dict if nothing was added
+        """
+        if self.count == 0:
+            return {}
+        
+        means = {key: value / self.count for key, value in self.sums.items()}
+        return {
+            'mean_colors': means['mean_colors'],
+            'std_colors': means['std_colors'],
+            'mean_intensity': float(means['mean_intensity']),
+            'std_intensity': float(means['std_intensity']),
+            'edge_density': float(means['edge_density']),
+            'region': self.region,
+            'count': self.count,
+            'histogram': {
+                'peak_intensity': float(means['peak_intensity']),
+                'hist_spread': float(means['hist_spread'])
+            }
+        }
+
+
 class ImageProcessor:
     """
     Processes images containing 9 emotion analysis graphs and creates averaged visualizations
@@ -20,31 +92,76 @@ class ImageProcessor:
         self.grid_size = (3, 3)  # 3x3 grid for 9 graphs
         self.min_image_size = (300, 300)
         self.default_output_size = (1200, 1200)
+        self.decode_workers = os.cpu_count() or 1  # cv2 decodes release the GIL
+        self.max_in_flight = 2 * self.decode_workers  # Decoded images waiting to be consumed
+    
+    def reduction_factor(self, image_size: Tuple[int, int], target_size: Optional[Tuple[int, int]]) -> int:
+        """
+        Pick the largest decode reduction that keeps the image at least as large as the target
+        
+        Args:
+            image_size (Tuple[int, int]): Stored image size (width, height)
+            target_size (Optional[Tuple[int, int]]): Size the image will be resized to (None for full resolution)
+            
+        Returns:
+            int: 1, 2, 4 or 8
+        """
+        if target_size is None:
+            return 1
+        
+        width, height = image_size
+        target_width, target_height = target_size
+        for factor in (8, 4, 2):
+            if width // factor >= target_width and height // factor >= target_height:
+                return factor
+        return 1
     
-    def load_and_validate_image(self, image_path: str) -> Optional[np.ndarray]:
+    def load_and_validate_image(self, image_path: str,
+                                target_size: Optional[Tuple[int, int]] = None) -> Optional[np.ndarray]:
         """
         Load and validate an image file
         
+        With a target size the image is decoded at a reduced resolution that is
+        still at least that large (1/2, 1/4 or 1/8 of the stored size), which is
+        much faster than decoding it in full and downscaling afterwards.
+        
         Args:
             image_path (str): Path to the image file
+            target_size (Optional[Tuple[int, int]]): Size the caller will resize to (width, height)
             
         Returns:
             Optional[np.ndarray]: Loaded image as numpy array or None if failed
         """
         try:
+            # Read the stored size from the header only (no pixel decoding)
+            try:
+                with Image.open(image_path) as pil_image:
+                    width, height = pil_image.size
+                factor = self.reduction_factor((width, height), target_size)
+            except Exception:
+                # Unknown to PIL; let OpenCV decode it in full
+                width = height = None
+                factor = 1
+            
             # Load image using OpenCV
-            image = cv2.imread(image_path)
+            image = cv2.imread(image_path, REDUCED_DECODE_FLAGS[factor])
             if image is None:
-                # Try with PIL if OpenCV fails
-                pil_image = Image.open(image_path)
-                image = cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR)
+                # Try with PIL if OpenCV fails (draft lets JPEG decoders scale while decoding)
+                with Image.open(image_path) as pil_image:
+                    if factor > 1:
+                        pil_image.draft('RGB', (width // factor, height // factor))
+                        pil_image = pil_image.convert('RGB')
+                        if pil_image.width >= 2 * (width // factor):
+                            pil_image = pil_image.reduce(factor)
+                    image = cv2.cvtColor(np.array(pil_image.convert('RGB')), cv2.COLOR_RGB2BGR)
             
             if image is None:
                 print(f"Failed to load image: {image_path}")
                 return None
             
-            # Basic validation
-            height, width = image.shape[:2]
+            # Basic validation (on the stored size, the decoded image may be reduced)
+            if width is None:
+                height, width = image.shape[:2]
             if height < self.min_image_size[0] or width < self.min_image_size[1]:
                 print(f"Image too small: {image_path} ({width}x{height})")
                 return None
@@ -55,6 +172,52 @@ class ImageProcessor:
             print(f"Error loading image {image_path}: {str(e)}")
             return None
     
+    def load_resized_image(self, image_path: str, target_size: Tuple[int, int]) -> Optional[np.ndarray]:
+        """
+        Decode an image at reduced resolution and resize it to the target size
+        
+        Args:
+            image_path (str): Path to the image file
+            target_size (Tuple[int, int]): Output size (width, height)
+            
+        Returns:
+            Optional[np.ndarray]: Resized image or None if loading failed
+        """
+        image = self.load_and_validate_image(image_path, target_size)
+        if image is None:
+            return None
+        return cv2.resize(image, target_size, interpolation=cv2.INTER_AREA)
+    
+    def iter_resized_images(self, image_paths: List[str],
+                            target_size: Tuple[int, int]) -> Iterator[Tuple[str, Optional[np.ndarray]]]:
+        """
+        Yield resized images in input order while a thread pool decodes ahead
+        
+        At most max_in_flight decoded images wait for the consumer, so memory stays
+        bounded no matter how many paths are given.
+        
+        Args:
+            image_paths (List[str]): Paths to the images
+            target_size (Tuple[int, int]): Output size (width, height)
+            
+        Yields:
+            Tuple[str, Optional[np.ndarray]]: (path, resized image or None if loading failed)
+        """
+        with ThreadPoolExecutor(max_workers=self.decode_workers) as executor:
+            remaining = iter(image_paths)
+            pending = deque()
+            for image_path in remaining:
+                pending.append((image_path, executor.submit(self.load_resized_image, image_path, target_size)))
+                if len(pending) >= self.max_in_flight:
+                    break
+            
+            while pending:
+                image_path, future = pending.popleft()
+                next_path = next(remaining, None)
+                if next_path is not None:
+                    pending.append((next_path, executor.submit(self.load_resized_image, next_path, target_size)))
+                yield image_path, future.result()
+    
     def detect_graph_regions(self, image: np.ndarray) -> List[Tuple[int, int, int, int]]:
         """
         Detect the 9 graph regions in the image
@@ -139,6 +302,77 @@ class ImageProcessor:
             'roi_shape': roi.shape
         }
     
+    def extract_all_graph_features(self, image: np.ndarray) -> List[dict]:
+        """
+        Extract the features of all 9 graph regions at once
+        
+        The image is converted to grayscale and edge-detected once, then viewed as
+        a 3x3 grid of blocks so every statistic is a single reduction over all
+        regions. Histograms come from one np.bincount over region-offset intensities.
+        
+        Args:
+            image (np.ndarray): Source image
+            
+        Returns:
+            List[dict]: Features per region, in the order of detect_graph_regions
+        """
+        regions = self.detect_graph_regions(image)
+        region_width, region_height = regions[0][2], regions[0][3]
+        rows, cols = self.grid_size
+        grid_height, grid_width = rows * region_height, cols * region_width
+        
+        # Blocks: (region, pixel) for grayscale/edges and (region, pixel, channel) for color
+        def blocks(array: np.ndarray) -> np.ndarray:
+            array = array[:grid_height, :grid_width]
+            shape = (rows, region_height, cols, region_width) + array.shape[2:]
+            block_shape = (rows * cols, region_height * region_width) + array.shape[2:]
+            return array.reshape(shape).swapaxes(1, 2).reshape(block_shape)
+        
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        edges = cv2.Canny(gray, 50, 150)
+        
+        color_blocks = blocks(image)
+        gray_blocks = blocks(gray)
+        
+        # Extract color and intensity statistics
+        mean_colors = color_blocks.mean(axis=1)
+        std_colors = color_blocks.std(axis=1)
+        mean_intensity = gray_blocks.mean(axis=1)
+        std_intensity = gray_blocks.std(axis=1)
+        
+        # Edge density for graph structure
+        edge_density = np.count_nonzero(blocks(edges), axis=1) / gray_blocks.shape[1]
+        
+        # Histograms of all regions in one pass
+        offsets = (np.arange(rows * cols, dtype=np.int64) * 256)[:, None]
+        hist = np.bincount((gray_blocks + offsets).ravel(), minlength=rows * cols * 256).reshape(rows * cols, 256)
+        
+        indices = np.arange(256)
+        weights_sum = hist.sum(axis=1)
+        safe_sum = np.maximum(weights_sum, 1)
+        weighted_mean = hist @ indices / safe_sum
+        weighted_variance = (hist * (indices - weighted_mean[:, None]) ** 2).sum(axis=1) / safe_sum
+        hist_spread = np.where(weights_sum > 0, np.sqrt(weighted_variance), 0.0)
+        peak_intensity = hist.argmax(axis=1)
+        
+        roi_shape = (region_height, region_width) + image.shape[2:]
+        return [
+            {
+                'region': region,
+                'mean_colors': mean_colors[i],
+                'std_colors': std_colors[i],
+                'mean_intensity': mean_intensity[i],
+                'std_intensity': std_intensity[i],
+                'edge_density': edge_density[i],
+                'histogram': {
+                    'peak_intensity': peak_intensity[i],
+                    'hist_spread': hist_spread[i]
+                },
+                'roi_shape': roi_shape
+            }
+            for i, region in enumerate(regions)
+        ]
+    
     def average_graph_features(self, features_list: List[dict]) -> dict:
         """
         Average features from multiple graphs in the same position
@@ -171,22 +405,27 @@ class ImageProcessor:
         
         return avg_features
     
-    def generate_averaged_graph(self, avg_features: dict, size: Tuple[int, int]) -> np.ndarray:
+    def generate_averaged_graph(self, avg_features: dict, size: Tuple[int, int],
+                                out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Generate a graph visualization from averaged features
         
         Args:
             avg_features (dict): Averaged features
             size (Tuple[int, int]): Output size (width, height)
+            out (Optional[np.ndarray]): Buffer (e.g. a view into the final image) to draw into
             
         Returns:
             np.ndarray: Generated graph image
         """
         width, height = size
         
-        # Create base image with averaged background color
+        # Fill the base image with averaged background color
         bg_color = avg_features['mean_colors'].astype(np.uint8)
-        graph_img = np.full((height, width, 3), bg_color, dtype=np.uint8)
+        if out is None:
+            out = np.empty((height, width, 3), dtype=np.uint8)
+        graph_img = out
+        graph_img[:] = bg_color
         
         # Add some visualization based on features
         center_x, center_y = width // 2, height // 2
@@ -241,43 +480,33 @@ class ImageProcessor:
             
             print(f"Processing {len(image_paths)} images...")
             
-            # Load and validate all images
-            valid_images = []
-            for img_path in image_paths:
-                img = self.load_and_validate_image(img_path)
-                if img is not None:
-                    valid_images.append(img)
-                else:
-                    print(f"Skipping invalid image: {img_path}")
+            # Images are decoded at reduced resolution and resized by a thread pool; each one is
+            # reduced to features as it arrives, so memory holds only the small decode-ahead window
+            target_size = self.default_output_size
+            accumulators = [GraphFeatureAccumulator() for _ in range(9)]  # 9 positions in 3x3 grid
+            loaded_images = 0
             
-            if not valid_images:
+            for img_path, img in self.iter_resized_images(image_paths, target_size):
+                if img is None:
+                    print(f"Skipping invalid image: {img_path}")
+                    continue
+                
+                for accumulator, features in zip(accumulators, self.extract_all_graph_features(img)):
+                    accumulator.add(features)
+                loaded_images += 1
+                del img
+            
+            if not loaded_images:
                 print("No valid images found")
                 return False
             
-            print(f"Successfully loaded {len(valid_images)} images")
-            
-            # Resize all images to same size for consistency
-            target_size = self.default_output_size
-            resized_images = []
-            for img in valid_images:
-                resized = cv2.resize(img, target_size)
-                resized_images.append(resized)
-            
-            # Extract features for each graph position across all images
-            all_graph_features = [[] for _ in range(9)]  # 9 positions in 3x3 grid
-            
-            for img in resized_images:
-                regions = self.detect_graph_regions(img)
-                for i, region in enumerate(regions):
-                    features = self.extract_graph_features(img, region)
-                    all_graph_features[i].append(features)
+            print(f"Successfully processed {loaded_images} images")
             
             # Average features for each graph position
             averaged_graph_features = []
-            for i in range(9):
-                if all_graph_features[i]:
-                    avg_features = self.average_graph_features(all_graph_features[i])
-                    averaged_graph_features.append(avg_features)
+            for i, accumulator in enumerate(accumulators):
+                if accumulator.count:
+                    averaged_graph_features.append(accumulator.average())
                 else:
                     print(f"No features found for graph position {i}")
                     return False
@@ -316,22 +545,20 @@ class ImageProcessor:
         graph_width = width // 3
         graph_height = height // 3
         
-        # Generate each graph and place it in the grid
+        # Draw each graph directly into its cell of the preallocated final image
         for i, features in enumerate(graph_features):
             row = i // 3
             col = i % 3
             
-            # Generate individual graph
-            graph_img = self.generate_averaged_graph(features, (graph_width, graph_height))
-            
             # Calculate position in final image
             x_start = col * graph_width
             y_start = row * graph_height
             x_end = x_start + graph_width
             y_end = y_start + graph_height
             
-            # Place graph in final image
-            final_image[y_start:y_end, x_start:x_end] = graph_img
+            # Generate individual graph in place
+            self.generate_averaged_graph(features, (graph_width, graph_height),
+                                         out=final_image[y_start:y_end, x_start:x_end])
             
             # Add grid lines for separation
             if col < 2:  # Vertical lines
@@ -353,9 +580,11 @@ class ImageProcessor:
             title (str): Title text
         """
         try:
-            # Convert to PIL for better text rendering
-            pil_image = Image.fromarray(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
-            draw = ImageDraw.Draw(pil_image)
+            # Render with PIL on the title strip only; black and white are the same in BGR
+            # and RGB, so the strip needs no color conversion
+            strip_height = min(image.shape[0], 41)
+            pil_strip = Image.fromarray(np.ascontiguousarray(image[:strip_height]))
+            draw = ImageDraw.Draw(pil_strip)
             
             # Try to load a font, fallback to default if not available
             try:
@@ -365,16 +594,15 @@ class ImageProcessor:
             
             # Calculate text position
             text_width = draw.textlength(title, font=font)
-            x = (pil_image.width - text_width) // 2
+            x = (pil_strip.width - text_width) // 2
             y = 10
             
             # Add text with background
-            draw.rectangle([x-5, y-5, x+text_width+5, y+30], fill=(255, 255, 255, 200))
+            draw.rectangle([x-5, y-5, x+text_width+5, y+30], fill=(255, 255, 255))
             draw.text((x, y), title, fill=(0, 0, 0), font=font)
             
-            # Convert back to OpenCV format
-            result = cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR)
-            image[:] = result
+            # Copy the strip back into the image
+            image[:strip_height] = np.asarray(pil_strip)
             
         except Exception as e:
             print(f"Error adding title: {str(e)}")
@@ -415,8 +643,7 @@ class ImageProcessor:
             
             # Check if regions contain graph-like content
             graph_count = 0
-            for region in regions:
-                features = self.extract_graph_features(image, region)
+            for features in self.extract_all_graph_features(image):
                 # Simple heuristic: if edge density is above threshold, likely contains a graph
                 if features['edge_density'] > 0.01:  # Adjust threshold as needed
                     graph_count += 1
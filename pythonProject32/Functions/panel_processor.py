@@ -0,0 +1,264 @@
+"""
+Panel Processor Module
+Averages the numeric panel sidecars (.npz) written next to each 9-graph image and re-renders the figure
+"""
+
+import os
+from typing import Dict, List, Optional
+
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+
+class PanelProcessor:
+    """
+    Averages the arrays behind the 9 emotion analysis graphs instead of their pixels
+    """
+
+    def __init__(self):
+        """Initialize the PanelProcessor"""
+        self.supported_format_versions = [1]
+        self.required_arrays = [
+            'sentiment_labels', 'sentiment_counts', 'sentiments', 'polarity', 'subjectivity',
+            'video_length', 'word_count', 'joy', 'emotions', 'emotion_averages',
+            'timeline_offsets', 'timeline_times', 'timeline_polarity'
+        ]
+        self.sentiment_colors = {'positive': 'green', 'negative': 'red', 'neutral': 'gray'}
+        self.figure_size = (20, 16)
+        self.dpi = 300
+        self.timeline_bin_seconds = 60  # Averaged timeline resolution
+
+    def load_panels(self, panel_path: str) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Load and validate a panel sidecar
+
+        Args:
+            panel_path (str): Path to the .npz file
+
+        Returns:
+            Optional[Dict[str, np.ndarray]]: Panel arrays or None if invalid
+        """
+        try:
+            with np.load(panel_path, allow_pickle=False) as sidecar:
+                panels = {name: sidecar[name] for name in sidecar.files}
+        except Exception as e:
+            print(f"Error loading panel data {panel_path}: {str(e)}")
+            return None
+
+        format_version = int(panels.get('panel_format', -1))
+        if format_version not in self.supported_format_versions:
+            print(f"Unsupported panel data format {format_version} in {panel_path}")
+            return None
+
+        missing = [name for name in self.required_arrays if name not in panels]
+        if missing:
+            print(f"Panel data {panel_path} is missing: {', '.join(missing)}")
+            return None
+
+        return panels
+
+    def average_panels(self, panel_list: List[Dict[str, np.ndarray]], labels: List[str]) -> dict:
+        """
+        Combine the panel arrays of several analyses
+
+        Per-video series (polarity, subjectivity, lengths, word counts, joy) are
+        pooled, sentiment counts are summed, emotion averages are averaged per
+        emotion and timelines are averaged per time bin.
+
+        Args:
+            panel_list (List[Dict[str, np.ndarray]]): Panel arrays per analysis
+            labels (List[str]): Name of each analysis (heatmap rows)
+
+        Returns:
+            dict: Averaged panel data
+        """
+        # Sentiment distribution: total videos per sentiment
+        sentiment_totals = {}
+        for panels in panel_list:
+            for label, count in zip(panels['sentiment_labels'], panels['sentiment_counts']):
+                sentiment_totals[str(label)] = sentiment_totals.get(str(label), 0) + int(count)
+
+        # Emotion averages aligned by emotion name (analyses x emotions, NaN where missing)
+        emotions = []
+        for panels in panel_list:
+            emotions.extend(str(emotion) for emotion in panels['emotions'] if str(emotion) not in emotions)
+        emotion_index = {emotion: column for column, emotion in enumerate(emotions)}
+
+        emotion_matrix = np.full((len(panel_list), len(emotions)), np.nan)
+        for row, panels in enumerate(panel_list):
+            columns = [emotion_index[str(emotion)] for emotion in panels['emotions']]
+            emotion_matrix[row, columns] = panels['emotion_averages']
+        emotion_means = np.nanmean(emotion_matrix, axis=0)
+
+        # Timelines: mean polarity per time bin over every sampled video
+        times = np.concatenate([panels['timeline_times'] for panels in panel_list])
+        polarities = np.concatenate([panels['timeline_polarity'] for panels in panel_list])
+        bins = (times // self.timeline_bin_seconds).astype(np.int64)
+        bin_counts = np.bincount(bins, minlength=1)
+        bin_sums = np.bincount(bins, weights=polarities, minlength=1)
+        occupied = bin_counts > 0
+
+        ranking = np.argsort(-emotion_means, kind='stable')
+
+        return {
+            'analysis_count': len(panel_list),
+            'sentiment_labels': list(sentiment_totals.keys()),
+            'sentiment_counts': list(sentiment_totals.values()),
+            'sentiments': np.concatenate([panels['sentiments'] for panels in panel_list]),
+            'polarity': np.concatenate([panels['polarity'] for panels in panel_list]),
+            'subjectivity': np.concatenate([panels['subjectivity'] for panels in panel_list]),
+            'video_length': np.concatenate([panels['video_length'] for panels in panel_list]),
+            'word_count': np.concatenate([panels['word_count'] for panels in panel_list]),
+            'joy': np.concatenate([panels['joy'] for panels in panel_list]),
+            'emotions': emotions,
+            'emotion_means': emotion_means,
+            'emotion_matrix': np.nan_to_num(emotion_matrix),
+            'analysis_labels': labels,
+            'timeline_minutes': np.flatnonzero(occupied) * self.timeline_bin_seconds / 60,
+            'timeline_polarity': bin_sums[occupied] / bin_counts[occupied],
+            'ranked_emotions': [emotions[i] for i in ranking],
+            'ranked_scores': emotion_means[ranking]
+        }
+
+    def render_averaged_figure(self, averaged: dict, output_path: str) -> None:
+        """
+        Draw the averaged 3x3 figure and save it
+
+        Args:
+            averaged (dict): Averaged panel data from average_panels
+            output_path (str): Image file to write
+        """
+        count = averaged['analysis_count']
+        sentiments = [str(sentiment) for sentiment in averaged['sentiments']]
+        polarities = averaged['polarity']
+        colors = [self.sentiment_colors.get(sentiment, 'blue') for sentiment in sentiments]
+
+        fig = plt.figure(figsize=self.figure_size)
+        try:
+            # 1. Sentiment distribution over all analyses
+            plt.subplot(3, 3, 1)
+            plt.pie(averaged['sentiment_counts'], labels=averaged['sentiment_labels'], autopct='%1.1f%%',
+                    colors=[self.sentiment_colors.get(label, 'blue') for label in averaged['sentiment_labels']])
+            plt.title(f'Overall Sentiment Distribution\nAcross {count} Analyses')
+
+            # 2. Polarity distribution of all videos
+            plt.subplot(3, 3, 2)
+            plt.hist(polarities, bins=15, alpha=0.7, color='skyblue', edgecolor='black')
+            plt.axvline(x=0, color='red', linestyle='--', alpha=0.7, label='Neutral')
+            plt.xlabel('Sentiment Polarity')
+            plt.ylabel('Number of Videos')
+            plt.title('Distribution of Sentiment Polarity')
+            plt.legend()
+            plt.grid(True, alpha=0.3)
+
+            # 3. Average emotion scores
+            plt.subplot(3, 3, 3)
+            emotion_means = averaged['emotion_means']
+            bars = plt.bar(averaged['emotions'], emotion_means, alpha=0.8)
+            max_score = emotion_means.max() if len(emotion_means) else 1
+            for bar, score in zip(bars, emotion_means):
+                bar.set_color(plt.cm.Reds(score / max_score if max_score > 0 else 0))
+            plt.title(f'Average Emotion Scores\nAcross {count} Analyses')
+            plt.xlabel('Emotions')
+            plt.ylabel('Average Score')
+            plt.xticks(rotation=45)
+            plt.grid(True, alpha=0.3, axis='y')
+
+            # 4. Video length vs sentiment
+            plt.subplot(3, 3, 4)
+            plt.scatter(averaged['video_length'] / 60, polarities, c=colors, alpha=0.7, s=60)
+            for sentiment, color in self.sentiment_colors.items():
+                plt.scatter([], [], c=color, label=sentiment.capitalize())
+            plt.xlabel('Video Length (minutes)')
+            plt.ylabel('Sentiment Polarity')
+            plt.title('Video Length vs Sentiment')
+            plt.legend()
+            plt.grid(True, alpha=0.3)
+
+            # 5. Emotion intensity per analysis
+            plt.subplot(3, 3, 5)
+            emotion_matrix = averaged['emotion_matrix']
+            image = plt.imshow(emotion_matrix, aspect='auto', cmap='YlOrRd')
+            plt.colorbar(image, label='Emotion Intensity')
+            plt.xticks(range(len(averaged['emotions'])), averaged['emotions'], rotation=45)
+            plt.yticks(range(len(averaged['analysis_labels'])), averaged['analysis_labels'], fontsize=7)
+            if emotion_matrix.size <= 150:
+                for (row, column), value in np.ndenumerate(emotion_matrix):
+                    plt.text(column, row, f'{value:.1f}', ha='center', va='center', fontsize=7)
+            plt.title('Emotion Intensity Heatmap\n(Per Analysis)')
+
+            # 6. Average sentiment timeline
+            plt.subplot(3, 3, 6)
+            plt.plot(averaged['timeline_minutes'], averaged['timeline_polarity'], marker='o', markersize=4,
+                     alpha=0.7, label='Mean of sample videos')
+            plt.xlabel('Time (minutes)')
+            plt.ylabel('Sentiment Polarity')
+            plt.title('Average Sentiment Timeline\n(Sample Videos)')
+            plt.legend()
+            plt.grid(True, alpha=0.3)
+
+            # 7. Word count vs joy
+            plt.subplot(3, 3, 7)
+            plt.scatter(averaged['word_count'], averaged['joy'], alpha=0.6, s=60, color='gold')
+            plt.xlabel('Word Count')
+            plt.ylabel('Joy Score')
+            plt.title('Video Length (Words) vs Joy')
+            plt.grid(True, alpha=0.3)
+
+            # 8. Subjectivity vs polarity
+            plt.subplot(3, 3, 8)
+            plt.scatter(polarities, averaged['subjectivity'], c=colors, alpha=0.7, s=60)
+            plt.xlabel('Sentiment Polarity')
+            plt.ylabel('Subjectivity')
+            plt.title('Sentiment vs Subjectivity')
+            plt.grid(True, alpha=0.3)
+
+            # 9. Ranked emotions
+            plt.subplot(3, 3, 9)
+            bars = plt.bar(averaged['ranked_emotions'], averaged['ranked_scores'], alpha=0.8)
+            for i, bar in enumerate(bars):
+                bar.set_color(plt.cm.viridis(i / len(bars)))
+            plt.title('Average Emotion Scores\n(Ranked)')
+            plt.xlabel('Emotions')
+            plt.ylabel('Average Score')
+            plt.xticks(rotation=45)
+            plt.grid(True, alpha=0.3, axis='y')
+
+            fig.suptitle('Averaged Emotion Analysis', fontsize=20)
+            plt.tight_layout()
+            fig.savefig(output_path, dpi=self.dpi, bbox_inches='tight')
+        finally:
+            plt.close(fig)
+
+    def create_averaged_figure(self, panel_paths: List[str], output_path: str) -> bool:
+        """
+        Average panel sidecars and render one averaged 9-graph figure
+
+        Args:
+            panel_paths (List[str]): Paths to .npz panel sidecars
+            output_path (str): Path to save the averaged image
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            panel_list, labels = [], []
+            for panel_path in panel_paths:
+                panels = self.load_panels(panel_path)
+                if panels is not None:
+                    panel_list.append(panels)
+                    labels.append(os.path.basename(os.path.dirname(panel_path)))
+
+            if not panel_list:
+                print("No valid panel data found!")
+                return False
+
+            print(f"Averaging panel data from {len(panel_list)} analyses...")
+            self.render_averaged_figure(self.average_panels(panel_list, labels), output_path)
+            return True
+
+        except Exception as e:
+            print(f"Error creating averaged figure: {str(e)}")
+            return False
@@ -0,0 +1,164 @@
+"""
+Report Parser Module
+Single-pass parser for the sentiment analysis reports written by Project 31
+"""
+
+import mmap
+import os
+import re
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Union
+
+
+# One token per report line: a rule (===/---), a "Label: value" line or an upper-case section header.
+# Lines matching none of these (blank lines, prose) are skipped.
+REPORT_TOKEN = re.compile(
+    rb'^(?P<indent>[ \t]*)(?:'
+    rb'(?P<rule>[=-])(?P=rule){4,}'
+    rb'|(?P<label>[^:\r\n]+?):[ \t]*(?P<value>[^\r\n]*?)'
+    rb'|(?P<header>[A-Z][A-Z0-9 &/]*[A-Z0-9])'
+    rb')[ \t\r]*$',
+    re.MULTILINE
+)
+
+# Numeric values: "1,126", "0.204", "11.3 hours", "5 videos (45.5%)", "41.7%"
+NUMERIC_VALUE = re.compile(
+    rb'(?P<number>[-+]?[\d,]*\.?\d+)[ \t]*(?P<unit>%|[A-Za-z]+)?'
+    rb'(?:[ \t]*\((?P<percent>[-+]?\d*\.?\d+)%\))?'
+)
+
+WORD = re.compile(rb'\S+')
+PARENTHETICAL = re.compile(r'\([^)]*\)')
+NAME_CLEANUP = re.compile(r'[^a-z0-9]+')
+
+# Section of the lines before the first "---" framed section header
+REPORT_SECTION = 'report'
+
+
+def normalize_name(text: str) -> str:
+    """
+    Turn a report label into a metric name ("Average Emotion Scores (ranked by intensity)" -> "average_emotion_scores")
+
+    Args:
+        text (str): Label as written in the report
+
+    Returns:
+        str: Lower-case name with underscores
+    """
+    return NAME_CLEANUP.sub('_', PARENTHETICAL.sub('', text.lower())).strip('_')
+
+
+def parse_number(text: bytes) -> Union[int, float]:
+    """
+    Parse a report number ("1,126" -> 1126, "0.204" -> 0.204)
+
+    Args:
+        text (bytes): Number as written in the report
+
+    Returns:
+        Union[int, float]: int if the number has no decimal point, float otherwise
+    """
+    text = text.replace(b',', b'')
+    return float(text) if b'.' in text else int(text)
+
+
+def parse_report(content: Union[bytes, mmap.mmap]) -> Dict[str, Any]:
+    """
+    Extract typed, section-qualified metrics from a report in one pass
+
+    Metric names are "<scope>.<label>", where the scope is the enclosing
+    subsection for indented lines ("sentiment_distribution.positive_videos",
+    "average_emotion_scores.joy", "most_positive_video.polarity") and the
+    section otherwise ("overall_statistics.total_duration_hours"). Units are
+    appended to the label; a "(45.5%)" suffix adds a separate "_percent" metric.
+    Values that are not numbers (dates, IDs, URLs) are kept as strings.
+
+    Args:
+        content (Union[bytes, mmap.mmap]): Report contents (a memory map is parsed without copying)
+
+    Returns:
+        Dict[str, Any]: Metric name -> int, float or str
+    """
+    metrics = {}
+    section = REPORT_SECTION
+    subsection = None
+    after_section_rule = False
+
+    for token in REPORT_TOKEN.finditer(content):
+        rule = token.group('rule')
+        if rule is not None:
+            after_section_rule = rule == b'-'
+            continue
+
+        header = token.group('header')
+        if header is not None:
+            # Only headers framed by "---" rules open a section (the "===" framed title does not)
+            if after_section_rule:
+                section = normalize_name(header.decode('utf-8'))
+                subsection = None
+            continue
+
+        after_section_rule = False
+        label = normalize_name(token.group('label').decode('utf-8', errors='replace'))
+        value = token.group('value')
+        if not label:
+            continue
+
+        # "Label:" with nothing after it opens a subsection for the indented lines below
+        if not value:
+            subsection = label
+            continue
+
+        scope = subsection if token.group('indent') and subsection else section
+        name = f"{scope}.{label}"
+
+        number = NUMERIC_VALUE.fullmatch(value)
+        if number is None:
+            metrics[name] = value.decode('utf-8', errors='replace')
+            continue
+
+        unit = number.group('unit')
+        if unit:
+            name += '_percent' if unit == b'%' else f"_{unit.decode('ascii').lower()}"
+        metrics[name] = parse_number(number.group('number'))
+
+        if number.group('percent') is not None:
+            metrics[f"{scope}.{label}_percent"] = float(number.group('percent'))
+
+    return metrics
+
+
+def count_words(content: Union[bytes, mmap.mmap]) -> int:
+    """
+    Count whitespace-separated words without decoding the content
+
+    Args:
+        content (Union[bytes, mmap.mmap]): Report contents
+
+    Returns:
+        int: Number of words
+    """
+    return sum(1 for _ in WORD.finditer(content))
+
+
+@contextmanager
+def map_report(file_path: str) -> Iterator[Union[bytes, mmap.mmap]]:
+    """
+    Memory-map a report file read-only (empty files yield b'', since they cannot be mapped)
+
+    Args:
+        file_path (str): Path to the report
+
+    Yields:
+        Union[bytes, mmap.mmap]: The file's contents
+    """
+    with open(file_path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            yield b''
+            return
+
+        content = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield content
+        finally:
+            content.close()
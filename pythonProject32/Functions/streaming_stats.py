@@ -0,0 +1,212 @@
+"""
+Streaming Statistics Module
+Constant-memory mean/std (Welford) and median (t-digest) for averaging many report files
+"""
+
+import math
+from bisect import bisect_left
+from typing import Any, Dict, List
+
+
+class RunningStats:
+    """
+    Running count, mean, sample standard deviation, min and max (Welford's algorithm)
+    """
+
+    def __init__(self):
+        """Initialize empty statistics"""
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        """
+        Add one value
+
+        Args:
+            value (float): Value to include
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    @property
+    def std_dev(self) -> float:
+        """Sample standard deviation (0.0 for fewer than two values)"""
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+
+class TDigest:
+    """
+    Merging t-digest for approximate quantiles in bounded memory
+
+    Values are buffered and periodically merged into at most about `compression`
+    centroids. Centroids near the tails stay small, so extreme quantiles are
+    accurate; small inputs (up to a few dozen values) keep every value and give
+    exact quantiles.
+    """
+
+    def __init__(self, compression: float = 100, buffer_size: int = 500):
+        """
+        Initialize the digest
+
+        Args:
+            compression (float): Accuracy/size trade-off (number of centroids is about this value)
+            buffer_size (int): Values buffered before they are merged into the centroids
+        """
+        self.compression = compression
+        self.buffer_size = buffer_size
+        self.means: List[float] = []
+        self.weights: List[float] = []
+        self.buffer: List[float] = []
+        self.total_weight = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        """
+        Add one value
+
+        Args:
+            value (float): Value to include
+        """
+        self.buffer.append(value)
+        self.total_weight += 1
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if len(self.buffer) >= self.buffer_size:
+            self._merge()
+
+    def _scale(self, q: float) -> float:
+        """k1 scale function mapping a quantile to the centroid index space"""
+        return self.compression / (2 * math.pi) * math.asin(2 * q - 1)
+
+    def _scale_inverse(self, k: float) -> float:
+        """Inverse of the scale function, clamped to a valid quantile"""
+        k = min(k, self.compression / 4)
+        return (math.sin(k * 2 * math.pi / self.compression) + 1) / 2
+
+    def _merge(self) -> None:
+        """Merge buffered values into the centroids"""
+        if not self.buffer:
+            return
+
+        points = sorted(zip(self.means + self.buffer, self.weights + [1.0] * len(self.buffer)))
+        self.buffer = []
+
+        means, weights = [], []
+        current_mean, current_weight = points[0]
+        weight_so_far = 0.0
+        q_limit = self._scale_inverse(self._scale(0.0) + 1)
+
+        for mean, weight in points[1:]:
+            proposed_weight = current_weight + weight
+            if (weight_so_far + proposed_weight) / self.total_weight <= q_limit:
+                current_mean += (mean - current_mean) * weight / proposed_weight
+                current_weight = proposed_weight
+            else:
+                means.append(current_mean)
+                weights.append(current_weight)
+                weight_so_far += current_weight
+                q_limit = self._scale_inverse(self._scale(weight_so_far / self.total_weight) + 1)
+                current_mean, current_weight = mean, weight
+
+        means.append(current_mean)
+        weights.append(current_weight)
+        self.means, self.weights = means, weights
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile
+
+        Args:
+            q (float): Quantile between 0 and 1 (0.5 for the median)
+
+        Returns:
+            float: Estimated value (NaN if no values were added)
+        """
+        self._merge()
+        if not self.means:
+            return math.nan
+        if len(self.means) == 1:
+            return self.means[0]
+
+        # Interpolate between centroid centres, anchored at the observed min and max
+        positions, values = [0.0], [self.min]
+        cumulative = 0.0
+        for mean, weight in zip(self.means, self.weights):
+            positions.append(cumulative + weight / 2)
+            values.append(mean)
+            cumulative += weight
+        positions.append(self.total_weight)
+        values.append(self.max)
+
+        target = q * self.total_weight
+        index = min(max(bisect_left(positions, target), 1), len(positions) - 1)
+        left, right = positions[index - 1], positions[index]
+        if right == left:
+            return values[index]
+        fraction = (target - left) / (right - left)
+        return values[index - 1] + fraction * (values[index] - values[index - 1])
+
+
+class StreamingEmotionAggregator:
+    """
+    Aggregates emotion data dictionaries one at a time in constant memory
+
+    Produces the same per-metric statistics as TextProcessor.average_emotion_data,
+    with the median estimated by a t-digest.
+    """
+
+    def __init__(self, compression: float = 100):
+        """
+        Initialize the aggregator
+
+        Args:
+            compression (float): t-digest compression used for the medians
+        """
+        self.compression = compression
+        self.stats: Dict[str, RunningStats] = {}
+        self.digests: Dict[str, TDigest] = {}
+        self.files_processed = 0
+
+    def add(self, data: Dict[str, Any]) -> None:
+        """
+        Add the emotion data extracted from one file
+
+        Args:
+            data (Dict[str, Any]): Emotion data dictionary
+        """
+        self.files_processed += 1
+        for key, value in data.items():
+            if key == '_metadata' or not isinstance(value, (int, float)):
+                continue
+            if key not in self.stats:
+                self.stats[key] = RunningStats()
+                self.digests[key] = TDigest(self.compression)
+            self.stats[key].add(value)
+            self.digests[key].add(value)
+
+    def result(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get the statistics of every metric seen so far
+
+        Returns:
+            Dict[str, Dict[str, float]]: mean, median, std_dev, min, max and count per metric
+        """
+        return {
+            key: {
+                'mean': stats.mean,
+                'median': self.digests[key].quantile(0.5),
+                'std_dev': stats.std_dev,
+                'min': stats.min,
+                'max': stats.max,
+                'count': stats.count
+            }
+            for key, stats in self.stats.items()
+        }
@@ -5,8 +5,11 @@ Handles text file processing and emotion analysis data averaging
 
 import re
 import os
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterable
 import statistics
+import numpy as np
+from streaming_stats import StreamingEmotionAggregator
+from report_parser import map_report, parse_report, count_words
 
 
 class TextProcessor:
@@ -26,6 +29,10 @@ class TextProcessor:
         """
         Extract emotion analysis data from a text file
         
+        Metrics are section-qualified and typed, e.g. "average_emotion_scores.joy"
+        (float) or "sentiment_distribution.positive_videos" (int); see
+        report_parser.parse_report.
+        
         Args:
             file_path (str): Path to the text file
             
@@ -33,47 +40,16 @@ class TextProcessor:
             Optional[Dict[str, Any]]: Extracted emotion data or None if failed
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-            
-            # Extract numerical values and their associated emotion labels
-            emotion_data = {}
-            
-            # Look for patterns like "emotion: value" or "emotion = value"
-            patterns = [
-                r'([a-zA-Z_]+)\s*[:\s=]\s*([-+]?\d*\.?\d+)',
-                r'([a-zA-Z_]+)\s*score\s*[:\s=]\s*([-+]?\d*\.?\d+)',
-                r'([a-zA-Z_]+)\s*value\s*[:\s=]\s*([-+]?\d*\.?\d+)',
-                r'([a-zA-Z_]+)\s*intensity\s*[:\s=]\s*([-+]?\d*\.?\d+)'
-            ]
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                for match in matches:
-                    emotion_name = match[0].lower().strip()
-                    try:
-                        emotion_value = float(match[1])
-                        emotion_data[emotion_name] = emotion_value
-                    except ValueError:
-                        continue
-            
-            # Also extract any percentage values
-            percentage_pattern = r'([a-zA-Z_]+)\s*[:\s=]\s*([-+]?\d*\.?\d+)%'
-            percentage_matches = re.findall(percentage_pattern, content, re.IGNORECASE)
-            for match in percentage_matches:
-                emotion_name = match[0].lower().strip() + '_percent'
-                try:
-                    emotion_value = float(match[1])
-                    emotion_data[emotion_name] = emotion_value
-                except ValueError:
-                    continue
-            
-            # Extract any metadata
-            metadata = {
-                'file_path': file_path,
-                'word_count': len(content.split()),
-                'char_count': len(content)
-            }
+            # The report is memory-mapped and parsed in a single regex pass over the mapped bytes
+            with map_report(file_path) as content:
+                emotion_data = parse_report(content)
+                
+                # Extract any metadata
+                metadata = {
+                    'file_path': file_path,
+                    'word_count': count_words(content),
+                    'char_count': len(content)
+                }
             emotion_data['_metadata'] = metadata
             
             return emotion_data if emotion_data else None
@@ -95,36 +71,76 @@ class TextProcessor:
         if not data_list:
             return {}
         
-        # Collect all unique keys (excluding metadata)
-        all_keys = set()
-        for data in data_list:
-            for key in data.keys():
-                if key != '_metadata' and isinstance(data[key], (int, float)):
-                    all_keys.add(key)
-        
-        averaged_data = {}
-        
-        # Calculate averages for each emotion metric
-        for key in all_keys:
-            values = []
-            for data in data_list:
-                if key in data and isinstance(data[key], (int, float)):
-                    values.append(data[key])
-            
-            if values:
-                averaged_data[key] = {
-                    'mean': statistics.mean(values),
-                    'median': statistics.median(values),
-                    'std_dev': statistics.stdev(values) if len(values) > 1 else 0.0,
-                    'min': min(values),
-                    'max': max(values),
-                    'count': len(values)
-                }
+        # Pack every file's metrics into one files x metrics array (NaN where a file lacks a metric)
+        key_index = {}
+        rows, columns, values = [], [], []
+        for row, data in enumerate(data_list):
+            for key, value in data.items():
+                if key != '_metadata' and isinstance(value, (int, float)):
+                    rows.append(row)
+                    columns.append(key_index.setdefault(key, len(key_index)))
+                    values.append(value)
+        
+        matrix = np.full((len(data_list), len(key_index)), np.nan)
+        matrix[rows, columns] = values
+        
+        # Calculate all statistics column-wise in one pass
+        present = ~np.isnan(matrix)
+        counts = present.sum(axis=0)
+        means = np.nansum(matrix, axis=0) / np.maximum(counts, 1)
+        squared_deviations = np.where(present, (matrix - means) ** 2, 0.0).sum(axis=0)
+        std_devs = np.sqrt(squared_deviations / np.maximum(counts - 1, 1))
+        std_devs[counts < 2] = 0.0
+        medians = np.nanmedian(matrix, axis=0) if matrix.size else means
+        minimums = np.nanmin(matrix, axis=0) if matrix.size else means
+        maximums = np.nanmax(matrix, axis=0) if matrix.size else means
+        
+        averaged_data = {
+            key: {
+                'mean': float(means[column]),
+                'median': float(medians[column]),
+                'std_dev': float(std_devs[column]),
+                'min': float(minimums[column]),
+                'max': float(maximums[column]),
+                'count': int(counts[column])
+            }
+            for key, column in key_index.items()
+        }
         
         # Add summary metadata
         averaged_data['_summary'] = {
             'total_files_processed': len(data_list),
-            'total_metrics': len(all_keys),
+            'total_metrics': len(key_index),
+            'processing_timestamp': self._get_timestamp()
+        }
+        
+        return averaged_data
+    
+    def average_emotion_stream(self, data_iter: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Calculate average values from emotion data dictionaries one at a time
+        
+        Uses constant memory regardless of the number of files (Welford for
+        mean/std, t-digest for the median), so thousands of reports can be
+        averaged without holding them all.
+        
+        Args:
+            data_iter (Iterable[Dict[str, Any]]): Emotion data dictionaries, e.g. a generator
+            
+        Returns:
+            Dict[str, Any]: Averaged emotion data (empty if the iterable was empty)
+        """
+        aggregator = StreamingEmotionAggregator()
+        for data in data_iter:
+            aggregator.add(data)
+        
+        if aggregator.files_processed == 0:
+            return {}
+        
+        averaged_data = aggregator.result()
+        averaged_data['_summary'] = {
+            'total_files_processed': aggregator.files_processed,
+            'total_metrics': len(averaged_data),
             'processing_timestamp': self._get_timestamp()
         }
         
@@ -162,7 +178,7 @@ class TextProcessor:
                         continue
                     
                     if isinstance(values, dict):
-                        file.write(f"{key.upper().replace('_', ' ')}:\n")
+                        file.write(f"{key.upper().replace('_', ' ').replace('.', ' / ')}:\n")
                         file.write(f"  Mean: {values.get('mean', 0):.4f}\n")
                         file.write(f"  Median: {values.get('median', 0):.4f}\n")
                         file.write(f"  Std Deviation: {values.get('std_dev', 0):.4f}\n")
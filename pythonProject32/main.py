@@ -13,6 +13,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'functions'))
 
 from text_processor import TextProcessor
 from image_processor import ImageProcessor
+from panel_processor import PanelProcessor
 from file_manager import FileManager
 
 
@@ -30,6 +31,7 @@ def main():
     file_manager = FileManager()
     text_processor = TextProcessor()
     image_processor = ImageProcessor()
+    panel_processor = PanelProcessor()
     
     try:
         # Check if input folder exists
@@ -48,19 +50,20 @@ def main():
             print("No subfolders found in the input directory!")
             return
         
-        # Process text files
+        # Process text files (streamed, so only one report is held in memory at a time)
         print("\nProcessing text files...")
-        text_data = []
-        for subfolder in subfolders:
-            text_file_path = file_manager.find_text_file(subfolder)
-            if text_file_path:
-                data = text_processor.extract_emotion_data(text_file_path)
-                if data:
-                    text_data.append(data)
-                    print(f"Processed text from: {subfolder}")
         
-        if text_data:
-            averaged_text_data = text_processor.average_emotion_data(text_data)
+        def iter_text_data():
+            for subfolder in subfolders:
+                text_file_path = file_manager.find_text_file(subfolder)
+                if text_file_path:
+                    data = text_processor.extract_emotion_data(text_file_path)
+                    if data:
+                        print(f"Processed text from: {subfolder}")
+                        yield data
+        
+        averaged_text_data = text_processor.average_emotion_stream(iter_text_data())
+        if averaged_text_data:
             output_text_path = os.path.join(output_folder, "averaged_emotion_analysis.txt")
             text_processor.save_averaged_data(averaged_text_data, output_text_path)
             print(f"Averaged text data saved to: {output_text_path}")
@@ -70,13 +73,25 @@ def main():
         # Process image files
         print("\nProcessing image files...")
         image_paths = []
+        panel_paths = []
         for subfolder in subfolders:
             image_file_path = file_manager.find_image_file(subfolder)
             if image_file_path:
                 image_paths.append(image_file_path)
                 print(f"Found image in: {subfolder}")
+                panel_file_path = file_manager.find_panel_file(subfolder)
+                if panel_file_path:
+                    panel_paths.append(panel_file_path)
         
-        if image_paths:
+        # Average the plotted data itself when every image has its panel sidecar
+        if image_paths and len(panel_paths) == len(image_paths):
+            output_image_path = os.path.join(output_folder, "averaged_emotion_graphs.png")
+            success = panel_processor.create_averaged_figure(panel_paths, output_image_path)
+            if success:
+                print(f"Averaged figure saved to: {output_image_path}")
+            else:
+                print("Failed to create averaged figure!")
+        elif image_paths:
             output_image_path = os.path.join(output_folder, "averaged_emotion_graphs.png")
             success = image_processor.create_averaged_image(image_paths, output_image_path)
             if success:
@@ -0,0 +1,183 @@
+"""
+Artifact hand-off for Project 33
+Stage outputs live once in a shared artifact directory; projects reference them through links
+"""
+
+import errno
+import json
+import os
+import shutil
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+
+MANIFEST_NAME = "manifest.json"
+
+
+def remove_reference(path: Path) -> None:
+    """Remove a link (or a leftover directory/file) at path"""
+    if path.is_symlink() or path.is_file():
+        path.unlink()
+    elif path.is_dir():
+        shutil.rmtree(path)
+
+
+def move_path(source: Path, target: Path) -> str:
+    """
+    Move source to target with an atomic rename
+
+    Falls back to copy-then-delete only when source and target are on different
+    devices. The copy goes to a temporary name first, so the target never holds
+    a partial tree.
+
+    Returns:
+        "rename" or "copy"
+    """
+    try:
+        os.replace(source, target)
+        return "rename"
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+
+    temp_target = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    if source.is_dir():
+        shutil.copytree(source, temp_target, symlinks=True)
+    else:
+        shutil.copy2(source, temp_target)
+    os.replace(temp_target, target)
+    remove_reference(source)
+    return "copy"
+
+
+def link_path(artifact: Path, reference: Path) -> str:
+    """
+    Make reference point at artifact without copying data
+
+    Tries a symlink first, then a tree of hardlinks (for systems where symlinks
+    need extra privileges), and copies only if both fail (e.g. across devices).
+
+    Returns:
+        "symlink", "hardlink" or "copy"
+    """
+    try:
+        os.symlink(artifact, reference, target_is_directory=artifact.is_dir())
+        return "symlink"
+    except OSError:
+        pass
+
+    try:
+        if artifact.is_dir():
+            for root, _, files in os.walk(artifact):
+                target_root = reference / Path(root).relative_to(artifact)
+                target_root.mkdir(parents=True, exist_ok=True)
+                for name in files:
+                    os.link(Path(root) / name, target_root / name)
+        else:
+            os.link(artifact, reference)
+        return "hardlink"
+    except OSError:
+        remove_reference(reference)
+
+    if artifact.is_dir():
+        shutil.copytree(artifact, reference)
+    else:
+        shutil.copy2(artifact, reference)
+    return "copy"
+
+
+class ArtifactStore:
+    """Shared artifact directory with a JSON manifest of what each stage produced"""
+
+    def __init__(self, root: Path):
+        self.root = Path(root).resolve()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.manifest_path = self.root / MANIFEST_NAME
+        self.lock = threading.Lock()
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self) -> dict:
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self) -> None:
+        temp_path = self.manifest_path.with_name(f".{MANIFEST_NAME}.tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(temp_path, self.manifest_path)
+
+    def path(self, name: str) -> Path:
+        """Location of an artifact inside the store"""
+        return self.root / name
+
+    def get(self, name: str) -> Optional[Path]:
+        """Location of a published artifact, or None if it is not in the store"""
+        artifact = self.path(name)
+        return artifact if name in self.manifest and artifact.exists() else None
+
+    def publish(self, name: str, source: Path, stage: str) -> Path:
+        """
+        Move a stage's output into the store
+
+        If source already is a link to this artifact, nothing moves.
+
+        Args:
+            name: Artifact name (relative path inside the store)
+            source: Output produced by the stage
+            stage: Stage that produced it (recorded in the manifest)
+
+        Returns:
+            The artifact's location in the store
+        """
+        artifact = self.path(name)
+        with self.lock:
+            if Path(source).resolve() != artifact:
+                artifact.parent.mkdir(parents=True, exist_ok=True)
+                if artifact.exists() or artifact.is_symlink():
+                    remove_reference(artifact)
+                method = move_path(Path(source), artifact)
+            else:
+                method = self.manifest.get(name, {}).get('method', 'rename')
+
+            self.manifest[name] = {
+                'stage': stage,
+                'method': method,
+                'published_at': datetime.now().isoformat(timespec='seconds'),
+                'references': self.manifest.get(name, {}).get('references', {})
+            }
+            self._save_manifest()
+        return artifact
+
+    def reference(self, name: str, reference: Path) -> str:
+        """
+        Expose an artifact at another path (replacing whatever is there)
+
+        Returns:
+            How the reference was made: "symlink", "hardlink" or "copy"
+        """
+        artifact = self.path(name)
+        reference = Path(reference)
+        with self.lock:
+            if reference.exists() or reference.is_symlink():
+                remove_reference(reference)
+            reference.parent.mkdir(parents=True, exist_ok=True)
+            method = link_path(artifact, reference)
+
+            entry = self.manifest.setdefault(name, {'references': {}})
+            entry.setdefault('references', {})[str(reference.absolute())] = method
+            self._save_manifest()
+        return method
+
+    def drop_reference(self, name: str, reference: Path) -> None:
+        """Remove a reference created by reference()"""
+        reference = Path(reference)
+        with self.lock:
+            if reference.exists() or reference.is_symlink():
+                remove_reference(reference)
+            self.manifest.get(name, {}).get('references', {}).pop(str(reference.absolute()), None)
+            self._save_manifest()
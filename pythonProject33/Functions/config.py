@@ -18,6 +18,10 @@ class Config:
     # Leave as None to use current Python, or specify path to specific Python
     PYTHON_EXECUTABLE = None  # Set to specific path if needed, e.g., r"C:\path\to\python.exe"
 
+    # Run Project 31 inside the orchestrator's interpreter (imports once for all CSVs)
+    # Set to False to start one Python process per CSV with PYTHON_EXECUTABLE instead
+    PROJECT_31_IN_PROCESS = True
+
     # Method 2: Forward slashes (alternative)
     # PROJECT_30_PATH = Path("C:/Users/Luciano Muratore/PycharmProjects/pythonProject30")
     # PROJECT_31_PATH = Path("C:/Users/Luciano Muratore/PycharmProjects/pythonProject31")
@@ -49,13 +53,35 @@ class Config:
     # Final output for Project 33
     FINAL_OUTPUT_PATTERN = "Output_{date}"
 
+    # Shared artifact directory: stage outputs are moved here once and referenced by
+    # symlink (or hardlinks) from each project instead of being copied between them.
+    # Keep it on the same drive as the projects so hand-offs are plain renames.
+    ARTIFACTS_PATTERN = "Artifacts_{date}"
+
+    # Run ledger (SQLite) recording every stage/CSV/video unit; used by main.py --resume
+    RUN_LEDGER_PATH = "run_ledger.sqlite"
+
     # Logging configuration
     LOG_LEVEL = "INFO"
     LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 
+    # CSV emptiness probe: data rows read at most before a CSV is handed to Project 31
+    CSV_PROBE_MAX_ROWS = 1000
+
     # Timeout settings (in seconds)
     PROJECT_TIMEOUT = 3600  # 1 hour timeout for each project
 
+    # Pipelined workflow: run the steps as a DAG of per-window tasks, so Project 31
+    # starts on a window as soon as Project 30 has written it
+    PIPELINED_WORKFLOW = False
+    PIPELINE_WINDOWS = 24  # last_1_days ... last_24_days (must match Project 30's MAX_DAYS)
+    PIPELINE_STAGE_LIMITS = {
+        'collect': 1,    # Project 30
+        'analyze': 2,    # Project 31, per window (in-process runs still take turns)
+        'aggregate': 1   # transfers, Project 32, final output
+    }
+    PIPELINE_POLL_INTERVAL = 5  # Seconds between checks for newly written windows
+
     # Non-critical error patterns that shouldn't stop execution
     NON_CRITICAL_ERRORS = [
         "pandas.errors.EmptyDataError",
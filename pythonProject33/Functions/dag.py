@@ -0,0 +1,174 @@
+"""
+DAG scheduling for Project 33
+Runs workflow tasks as soon as their dependencies finish, with per-stage concurrency limits
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Dict, Iterable, List, Optional
+
+
+# Task states
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+SKIPPED = "skipped"
+FAILED = "failed"
+BLOCKED = "blocked"
+
+
+class Task:
+    """A unit of work in the workflow DAG"""
+
+    def __init__(self, name: str, stage: str, action: Callable[[], bool],
+                 dependencies: Iterable[str] = (),
+                 is_complete: Optional[Callable[[], bool]] = None,
+                 is_available: Optional[Callable[[], bool]] = None):
+        """
+        Args:
+            name: Unique task name
+            stage: Stage the task belongs to (concurrency limits are per stage)
+            action: Callable doing the work; returns True on success
+            dependencies: Names of tasks that must finish first
+            is_complete: Returns True if the task's output already exists (task is skipped)
+            is_available: Returns True once an external input has landed (polled)
+        """
+        self.name = name
+        self.stage = stage
+        self.action = action
+        self.dependencies = list(dependencies)
+        self.is_complete = is_complete
+        self.is_available = is_available
+        self.state = PENDING
+
+
+class DagScheduler:
+    """Schedules DAG tasks on a thread pool, starting each one as soon as it is ready"""
+
+    def __init__(self, stage_limits: Dict[str, int], logger: Optional[logging.Logger] = None,
+                 poll_interval: float = 5.0):
+        """
+        Args:
+            stage_limits: Maximum concurrently running tasks per stage (stages not listed run one at a time)
+            logger: Logger for progress messages
+            poll_interval: Seconds between checks of tasks waiting on an external input
+        """
+        self.stage_limits = stage_limits
+        self.logger = logger or logging.getLogger(__name__)
+        self.poll_interval = poll_interval
+
+    def validate(self, tasks: Dict[str, Task]) -> None:
+        """Raise ValueError on unknown dependencies or cycles"""
+        for task in tasks.values():
+            for dependency in task.dependencies:
+                if dependency not in tasks:
+                    raise ValueError(f"Task {task.name} depends on unknown task {dependency}")
+
+        visiting, visited = set(), set()
+
+        def visit(name):
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle through task {name}")
+            visiting.add(name)
+            for dependency in tasks[name].dependencies:
+                visit(dependency)
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in tasks:
+            visit(name)
+
+    def run(self, task_list: List[Task]) -> Dict[str, str]:
+        """
+        Run all tasks
+
+        Returns:
+            Final state of every task by name
+        """
+        tasks = {task.name: task for task in task_list}
+        self.validate(tasks)
+
+        dependents = {name: [] for name in tasks}
+        for task in tasks.values():
+            for dependency in task.dependencies:
+                dependents[dependency].append(task.name)
+
+        running_per_stage = {}
+        max_workers = max(1, sum(self.stage_limits.get(stage, 1) for stage in {task.stage for task in tasks.values()}))
+
+        def block_dependents(name):
+            for dependent in dependents[name]:
+                if tasks[dependent].state == PENDING:
+                    tasks[dependent].state = BLOCKED
+                    self.logger.warning(f"BLOCKED: {dependent} (upstream {name} did not succeed)")
+                    block_dependents(dependent)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+
+            while True:
+                waiting_on_input = False
+                rescan = True
+
+                # Skipping a task can make its dependents ready, so scan until nothing changes
+                while rescan:
+                    rescan = False
+                    for task in tasks.values():
+                        if task.state != PENDING:
+                            continue
+                        if any(tasks[dependency].state not in (DONE, SKIPPED) for dependency in task.dependencies):
+                            continue
+
+                        if task.is_complete is not None and task.is_complete():
+                            task.state = SKIPPED
+                            self.logger.info(f"SKIPPED: {task.name} (output already exists)")
+                            rescan = True
+                            continue
+
+                        if running_per_stage.get(task.stage, 0) >= self.stage_limits.get(task.stage, 1):
+                            continue
+
+                        if task.is_available is not None and not task.is_available():
+                            waiting_on_input = True
+                            continue
+
+                        task.state = RUNNING
+                        running_per_stage[task.stage] = running_per_stage.get(task.stage, 0) + 1
+                        self.logger.info(f"START: {task.name} [{task.stage}]")
+                        futures[executor.submit(task.action)] = task
+
+                if not futures:
+                    if not waiting_on_input:
+                        break
+                    time.sleep(self.poll_interval)
+                    continue
+
+                finished, _ = wait(futures, timeout=self.poll_interval if waiting_on_input else None,
+                                   return_when=FIRST_COMPLETED)
+
+                for future in finished:
+                    task = futures.pop(future)
+                    running_per_stage[task.stage] -= 1
+                    try:
+                        succeeded = future.result()
+                    except Exception as e:
+                        self.logger.error(f"ERROR: {task.name} raised: {e}")
+                        succeeded = False
+
+                    if succeeded:
+                        task.state = DONE
+                        self.logger.info(f"DONE: {task.name}")
+                    else:
+                        task.state = FAILED
+                        self.logger.error(f"FAILED: {task.name}")
+                        block_dependents(task.name)
+
+        # Anything still pending could never become ready
+        for task in tasks.values():
+            if task.state == PENDING:
+                task.state = BLOCKED
+
+        return {name: task.state for name, task in tasks.items()}
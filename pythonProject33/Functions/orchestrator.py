@@ -3,24 +3,35 @@ Core orchestration logic for Project 33
 Handles running projects in sequence and managing data flow
 """
 
+import csv
+import itertools
 import os
-import shutil
 import subprocess
 import sys
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
 from typing import Tuple, Optional
 
+from .artifacts import ArtifactStore, move_path, remove_reference
 from .config import Config
+from .dag import Task, DagScheduler
+from .process_runner import run_streaming
+from .project_loader import load_project_31_analyzer
+from .run_ledger import RunLedger, fingerprint_file, fingerprint_values, DONE, FAILED
 from .utils import setup_logging, validate_path, create_directory
 
 
 class ProjectOrchestrator:
-    def __init__(self, execution_date: str):
+    def __init__(self, execution_date: str, resume: bool = False):
         self.execution_date = execution_date
+        self.resume = resume
         self.logger = setup_logging(f"project_33_{execution_date}")
 
+        # Every stage/window/video unit is recorded so a rerun with resume=True skips finished work
+        self.ledger = RunLedger(Path(Config.RUN_LEDGER_PATH), execution_date)
+
         # Output directory names based on updated patterns
         self.output_30 = Config.get_output_dir_name(30, execution_date)  # Videos{date}
         self.output_31 = Config.get_output_dir_name(31, execution_date)  # analysis_{date}
@@ -31,10 +42,21 @@ class ProjectOrchestrator:
         self.input_31 = Config.get_input_dir_name(31, execution_date)  # Videos{date}
         self.input_32 = Config.get_input_dir_name(32, execution_date)  # analysis_{date}
 
+        # Stage outputs are handed over through one artifact directory instead of being copied
+        self.artifacts = ArtifactStore(Path(Config.ARTIFACTS_PATTERN.format(date=execution_date)))
+
+        # Pipelined workflow state
+        self.collection_finished = False
+        self.project_31_analyzer = None
+        self.project_31_lock = threading.Lock()  # In-process analyses share matplotlib state
+
         self.logger.info(f"Orchestrator initialized for date: {execution_date}")
         self.logger.info(f"Project 30 output: {self.output_30}")
         self.logger.info(f"Project 31 input: {self.input_31}, output: {self.output_31}")
         self.logger.info(f"Project 32 input: {self.input_32}, output: {self.output_32}")
+        self.logger.info(f"Artifact directory: {self.artifacts.root}")
+        if resume:
+            self.logger.info(f"Resuming: units completed in earlier runs are skipped ({Config.RUN_LEDGER_PATH})")
 
     def validate_all_projects(self) -> bool:
         """Validate that all required projects and scripts exist"""
@@ -119,10 +141,13 @@ class ProjectOrchestrator:
         return csv_files
 
     def check_csv_file_empty(self, csv_path):
-        """Check if CSV file is empty or has no data"""
-        try:
-            import pandas as pd
+        """
+        Check if CSV file is empty or has no data
 
+        Only the header and the first data rows are read (up to Config.CSV_PROBE_MAX_ROWS
+        when leading rows are blank); Project 31 parses the file itself afterwards.
+        """
+        try:
             # First check if file exists and has content
             if not os.path.exists(csv_path):
                 return True, "CSV file does not exist"
@@ -131,23 +156,28 @@ class ProjectOrchestrator:
             if os.path.getsize(csv_path) == 0:
                 return True, "CSV file is empty (0 bytes)"
 
-            # Try to read the CSV with pandas
-            df = pd.read_csv(csv_path)
+            with open(csv_path, 'r', encoding='utf-8-sig', errors='replace', newline='') as f:
+                reader = csv.reader(f)
+                header = next(reader, None)
 
-            if df.empty:
-                return True, "CSV file is empty (no rows)"
-            if len(df.columns) == 0:
-                return True, "CSV file has no columns"
+                if not header or not any(column.strip() for column in header):
+                    return True, "CSV file has no columns"
 
-            # Check if all values are NaN
-            if df.isnull().all().all():
-                return True, "CSV file contains only NaN values"
+                rows_seen = 0
+                for row in itertools.islice(reader, Config.CSV_PROBE_MAX_ROWS):
+                    rows_seen += 1
+                    if any(value.strip() for value in row):
+                        return False, f"CSV file has data ({len(header)} columns)"
 
-            return False, f"CSV file has {len(df)} rows and {len(df.columns)} columns"
+            if rows_seen == 0:
+                return True, "CSV file is empty (no rows)"
+            if rows_seen < Config.CSV_PROBE_MAX_ROWS:
+                return True, "CSV file contains only empty values"
 
-        except pd.errors.EmptyDataError:
-            return True, "CSV file is empty (EmptyDataError)"
-        except pd.errors.ParserError as e:
+            # Probe limit reached on blank rows only; let Project 31 decide
+            return False, f"CSV file has {rows_seen}+ blank leading rows (assuming not empty)"
+
+        except csv.Error as e:
             return True, f"CSV parsing error: {e}"
         except Exception as e:
             # If we can't read it, let's try to continue anyway
@@ -158,15 +188,18 @@ class ProjectOrchestrator:
         """Organize Project 31 output folders into analysis_{date} structure"""
         project_path = Config.PROJECT_31_PATH
 
-        # Create the main analysis folder
+        # The analysis folder lives in the artifact directory; analysis_{date} references it
         analysis_folder_name = f"analysis_{self.execution_date}"
         analysis_folder_path = project_path / analysis_folder_name
+        analysis_artifact_path = self.artifacts.path("analysis")
 
-        self.logger.info(f"Organizing Project 31 output into: {analysis_folder_path}")
+        self.logger.info(f"Organizing Project 31 output into: {analysis_artifact_path}")
 
         try:
-            # Create the analysis folder if it doesn't exist
-            analysis_folder_path.mkdir(exist_ok=True)
+            # Adopt an analysis folder left by an earlier run, then make sure the artifact exists
+            if analysis_folder_path.exists() and analysis_folder_path.resolve() != analysis_artifact_path:
+                self.artifacts.publish("analysis", analysis_folder_path, stage="project_31")
+            analysis_artifact_path.mkdir(parents=True, exist_ok=True)
 
             # Find all analysis_results folders
             moved_folders = 0
@@ -175,18 +208,21 @@ class ProjectOrchestrator:
                         item.name.startswith("analysis_results_most_viewed_last_") and
                         self.execution_date.replace("-", "") in item.name):
 
-                    # Move the folder into the analysis directory
-                    target_path = analysis_folder_path / item.name
+                    # Rename the folder into the analysis artifact
+                    target_path = analysis_artifact_path / item.name
 
-                    # Remove target if it exists
+                    # Replace a result from an earlier run
                     if target_path.exists():
-                        shutil.rmtree(target_path)
+                        remove_reference(target_path)
 
-                    # Move the folder
-                    shutil.move(str(item), str(target_path))
-                    self.logger.info(f"Moved: {item.name} -> {analysis_folder_name}/{item.name}")
+                    method = move_path(item, target_path)
+                    self.logger.info(f"Moved ({method}): {item.name} -> {analysis_folder_name}/{item.name}")
                     moved_folders += 1
 
+            self.artifacts.publish("analysis", analysis_artifact_path, stage="project_31")
+            link_method = self.artifacts.reference("analysis", analysis_folder_path)
+            self.logger.info(f"Referenced analysis artifact at {analysis_folder_path} ({link_method})")
+
             self.logger.info(f"Successfully organized {moved_folders} analysis folders into {analysis_folder_name}")
             return moved_folders > 0
 
@@ -194,6 +230,49 @@ class ProjectOrchestrator:
             self.logger.error(f"Error organizing Project 31 output: {e}")
             return False
 
+    def run_ledger_unit(self, stage: str, unit: str, fingerprint: str, action, output_exists=None) -> bool:
+        """
+        Run a workflow unit and record it in the run ledger
+
+        When resuming, a unit that already completed with the same input fingerprint
+        (and whose output still exists) is skipped.
+        """
+        if (self.resume and self.ledger.is_done(stage, unit, fingerprint) and
+                (output_exists is None or output_exists())):
+            self.logger.info(f"RESUME: {stage} {unit} completed in an earlier run, skipping")
+            return True
+
+        self.ledger.start(stage, unit, fingerprint)
+        try:
+            success = action()
+        except Exception as e:
+            self.ledger.finish(stage, unit, FAILED, detail=str(e))
+            raise
+        self.ledger.finish(stage, unit, DONE if success else FAILED)
+        return success
+
+    def run_project_31_csv_in_process(self, analyzer_class, csv_path: Path) -> bool:
+        """Run one CSV through an already imported Project 31 analyzer"""
+        csv_name = csv_path.stem
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_folder = Config.PROJECT_31_PATH.resolve() / f"analysis_results_{csv_name}_{timestamp}"
+
+        try:
+            analyzer = analyzer_class(str(csv_path.resolve()), str(output_folder))
+            success = analyzer.run_analysis()
+
+            # Record the analyzed videos in the run ledger
+            for video_id in analyzer.results.video_ids:
+                self.ledger.finish("analyze_video", video_id, DONE, detail=csv_path.name)
+            return success
+        except Exception as e:
+            self.logger.warning(f"In-process analysis of {csv_path.name} raised: {e}")
+            return False
+        finally:
+            # Release the figures of this CSV before the next one
+            import matplotlib.pyplot as plt
+            plt.close('all')
+
     def run_project_31_with_csvs(self) -> bool:
         """Run Project 31 with each CSV file found"""
         project_path = Config.PROJECT_31_PATH
@@ -231,6 +310,15 @@ class ProjectOrchestrator:
             if os.name == 'nt':  # Windows
                 env['PYTHONLEGACYWINDOWSSTDIO'] = '1'
 
+            # Import the analyzer once instead of starting an interpreter per CSV
+            analyzer_class = None
+            if Config.PROJECT_31_IN_PROCESS:
+                analyzer_class = load_project_31_analyzer(project_path, self.logger)
+                if analyzer_class is None:
+                    self.logger.warning("Falling back to one subprocess per CSV")
+                else:
+                    self.logger.info("Running Project 31 in-process")
+
             # Process each CSV file
             for i, csv_file in enumerate(csv_files, 1):
                 self.logger.info(f"Processing CSV {i}/{total_runs}: {csv_file}")
@@ -244,51 +332,44 @@ class ProjectOrchestrator:
                     self.logger.info(f"Skipping empty CSV file and continuing...")
                     continue
 
+                # Skip CSVs an earlier run already analyzed (same file contents)
+                csv_fingerprint = fingerprint_file(full_csv_path)
+                if self.resume and self.ledger.is_done("analyze_csv", csv_file, csv_fingerprint):
+                    self.logger.info(f"RESUME: CSV {i} already analyzed in an earlier run, skipping")
+                    successful_runs += 1
+                    continue
+                self.ledger.start("analyze_csv", csv_file, csv_fingerprint)
+
+                if analyzer_class is not None:
+                    import time as time_module
+                    start_time = time_module.time()
+                    success = self.run_project_31_csv_in_process(analyzer_class, full_csv_path)
+                    execution_time = time_module.time() - start_time
+                    self.ledger.finish("analyze_csv", csv_file, DONE if success else FAILED)
+
+                    if success:
+                        self.logger.info(f"SUCCESS: CSV {i} processed successfully in {execution_time:.2f} seconds")
+                    else:
+                        self.logger.warning(f"WARNING: CSV {i} analysis failed after {execution_time:.2f} seconds")
+                    # Continue processing other CSVs even if one fails
+                    successful_runs += 1
+                    continue
+
                 # Prepare command with CSV file path
                 python_executable = Config.PYTHON_EXECUTABLE or sys.executable
                 command = [python_executable, script_name, csv_file]
 
                 self.logger.info(f"Running command: {' '.join(command)}")
 
-                # Execute Project 31 with the specific CSV
-                import time as time_module
-                start_time = time_module.time()
-
-                if os.name == 'nt':  # Windows
-                    result = subprocess.run(
-                        command,
-                        capture_output=True,
-                        text=True,
-                        timeout=Config.PROJECT_TIMEOUT,
-                        env=env,
-                        check=False,
-                        encoding='utf-8',
-                        errors='replace'
-                    )
-                else:
-                    result = subprocess.run(
-                        command,
-                        capture_output=True,
-                        text=True,
-                        timeout=Config.PROJECT_TIMEOUT,
-                        env=env,
-                        check=False
-                    )
-
-                execution_time = time_module.time() - start_time
-
-                # Log output
-                if result.stdout:
-                    self.logger.info(f"CSV {i} stdout:")
-                    for line in result.stdout.strip().split('\n'):
-                        if line.strip():
-                            self.logger.info(f"  {line}")
-
-                if result.stderr:
-                    self.logger.warning(f"CSV {i} stderr (errors/warnings):")
-                    for line in result.stderr.strip().split('\n'):
-                        if line.strip():
-                            self.logger.warning(f"  {line}")
+                # Execute Project 31 with the specific CSV (output is logged as it is printed)
+                result = run_streaming(command, self.logger, f"CSV {i}", timeout=Config.PROJECT_TIMEOUT, env=env)
+                execution_time = result.execution_time
+
+                if result.timed_out:
+                    self.ledger.finish("analyze_csv", csv_file, FAILED, detail="timeout")
+                    raise subprocess.TimeoutExpired(command, Config.PROJECT_TIMEOUT)
+                self.ledger.finish("analyze_csv", csv_file, DONE if result.returncode == 0 else FAILED,
+                                   detail=f"exit code {result.returncode}")
 
                 # Check result
                 if result.returncode == 0:
@@ -322,6 +403,8 @@ class ProjectOrchestrator:
             self.logger.error(f"ERROR: Unexpected error running {project_name}: {e}")
             os.chdir(original_cwd)
             return False
+
+    def verify_project_output(self, project_num: int) -> bool:
         """Verify that project produced expected output despite any errors"""
         import time
 
@@ -447,9 +530,8 @@ class ProjectOrchestrator:
         self.logger.info(f"Starting execution of {project_name}")
 
         try:
-            # Change to project directory
-            original_cwd = os.getcwd()
-            os.chdir(project_path)
+            # Run from the project directory (passed as cwd so other threads keep theirs)
+            working_dir = project_path
 
             # Check if project requires subdirectory change (Project 31 needs youtube-sentiment-analyzer)
             subdirectory = Config.get_project_subdirectory(project_num)
@@ -457,11 +539,10 @@ class ProjectOrchestrator:
                 subdirectory_path = project_path / subdirectory
                 if not validate_path(subdirectory_path):
                     self.logger.error(f"Required subdirectory not found: {subdirectory_path}")
-                    os.chdir(original_cwd)
                     return False
 
-                os.chdir(subdirectory_path)
-                self.logger.info(f"Changed to subdirectory: {subdirectory_path}")
+                working_dir = subdirectory_path
+                self.logger.info(f"Running from subdirectory: {subdirectory_path}")
 
             # Prepare environment variables (pass today's date)
             env = os.environ.copy()
@@ -482,52 +563,21 @@ class ProjectOrchestrator:
                 argument = Config.get_project_argument(project_num, self.execution_date)
                 command.append(argument)
                 self.logger.info(f"{project_name} command: {' '.join(command)}")
-                self.logger.info(f"Executing from directory: {os.getcwd()}")
+                self.logger.info(f"Executing from directory: {working_dir}")
 
-            # Execute the project with timeout
-            start_time = time.time()
+            # Execute the project with timeout, logging stdout/stderr while it runs
+            result = run_streaming(command, self.logger, project_name, timeout=Config.PROJECT_TIMEOUT,
+                                   env=env, cwd=working_dir)
+            execution_time = result.execution_time
 
-            # Handle encoding issues on Windows
-            if os.name == 'nt':  # Windows
-                result = subprocess.run(
-                    command,
-                    capture_output=True,
-                    text=True,
-                    timeout=Config.PROJECT_TIMEOUT,
-                    env=env,
-                    check=False,  # Don't raise exception on non-zero exit codes
-                    encoding='utf-8',
-                    errors='replace'  # Replace problematic characters instead of failing
-                )
-            else:
-                result = subprocess.run(
-                    command,
-                    capture_output=True,
-                    text=True,
-                    timeout=Config.PROJECT_TIMEOUT,
-                    env=env,
-                    check=False  # Don't raise exception on non-zero exit codes
-                )
-
-            execution_time = time.time() - start_time
-
-            # Log all output (both stdout and stderr)
-            if result.stdout:
-                self.logger.info(f"{project_name} stdout:")
-                for line in result.stdout.strip().split('\n'):
-                    if line.strip():
-                        self.logger.info(f"  {line}")
-
-            if result.stderr:
-                self.logger.warning(f"{project_name} stderr (errors/warnings):")
-                for line in result.stderr.strip().split('\n'):
-                    if line.strip():
-                        self.logger.warning(f"  {line}")
+            if result.timed_out:
+                self.logger.error(f"{project_name} execution timed out after {Config.PROJECT_TIMEOUT} seconds "
+                                  f"(output up to the timeout is logged above)")
+                return False
 
             # Check the return code
             if result.returncode == 0:
                 self.logger.info(f"SUCCESS: {project_name} completed successfully in {execution_time:.2f} seconds")
-                os.chdir(original_cwd)
                 return True
             else:
                 self.logger.warning(
@@ -538,33 +588,20 @@ class ProjectOrchestrator:
                     self.logger.info(
                         f"SUCCESS: {project_name} produced expected output despite exit code {result.returncode}")
                     self.logger.info(f"Continuing workflow as project completed its task")
-                    os.chdir(original_cwd)
                     return True
                 else:
                     self.logger.error(
                         f"FAILED: {project_name} failed - exit code {result.returncode} and no expected output found")
-                    os.chdir(original_cwd)
-                    return False
-
-        except subprocess.TimeoutExpired:
-            self.logger.error(f"{project_name} execution timed out after {Config.PROJECT_TIMEOUT} seconds")
-            os.chdir(original_cwd)
-            return False
-        except subprocess.CalledProcessError as e:
-            self.logger.error(f"{project_name} execution failed with return code {e.returncode}")
-            self.logger.error(f"{project_name} stderr: {e.stderr}")
 
-            # Check for common dependency issues
-            if "ModuleNotFoundError" in str(e.stderr):
-                self.logger.error("DEPENDENCY ISSUE DETECTED!")
-                self.logger.error("Suggestion: Check if all required modules are installed")
-                self.logger.error(f"Try running: pip install -r requirements.txt in {project_path}")
+                    # Check for common dependency issues in the last stderr lines
+                    if "ModuleNotFoundError" in result.stderr:
+                        self.logger.error("DEPENDENCY ISSUE DETECTED!")
+                        self.logger.error("Suggestion: Check if all required modules are installed")
+                        self.logger.error(f"Try running: pip install -r requirements.txt in {project_path}")
+                    return False
 
-            os.chdir(original_cwd)
-            return False
         except Exception as e:
             self.logger.error(f"Unexpected error running {project_name}: {e}")
-            os.chdir(original_cwd)
             return False
 
     def find_actual_output_folder(self, project_num: int) -> str:
@@ -622,6 +659,7 @@ class ProjectOrchestrator:
 
         # Get appropriate folder names based on project workflow
         if source_project_num == 30 and target_project_num == 31:
+            artifact_name = "videos"
             # Project 30 output -> Project 31 youtube-sentiment-analyzer subdirectory
             # Find the actual folder that was created
             source_folder_name = self.find_actual_output_folder(30)
@@ -633,6 +671,7 @@ class ProjectOrchestrator:
 
         elif source_project_num == 31 and target_project_num == 32:
             # Project 31 output (analysis_{date}) -> Project 32 input (analysis_{date})
+            artifact_name = "analysis"
             source_folder_name = self.find_actual_output_folder(31)
             target_folder_name = source_folder_name
             target_input = target_path / target_folder_name
@@ -661,14 +700,15 @@ class ProjectOrchestrator:
                     self.logger.error(f"youtube-sentiment-analyzer directory not found: {youtube_analyzer_path}")
                     return False
 
-            # Remove existing target directory if it exists
-            if target_input.exists():
-                shutil.rmtree(target_input)
-                self.logger.info(f"Removed existing target directory: {target_input}")
+            # Move the output into the artifact directory (a rename; no-op if already there)
+            artifact = self.artifacts.publish(artifact_name, source_output, stage=f"project_{source_project_num}")
 
-            # Move the output directory
-            shutil.move(str(source_output), str(target_input))
-            self.logger.info(f"Successfully transferred: {source_output} -> {target_input}")
+            # Reference it as the target project's input, then drop the source's reference
+            link_method = self.artifacts.reference(artifact_name, target_input)
+            if source_output.exists() or source_output.is_symlink():
+                self.artifacts.drop_reference(artifact_name, source_output)
+            self.logger.info(f"Successfully transferred: {source_output} -> {target_input} "
+                             f"(artifact {artifact}, {link_method})")
 
             return True
 
@@ -689,14 +729,12 @@ class ProjectOrchestrator:
                 self.logger.error(f"Project 32 output not found: {source_output}")
                 return False
 
-            # Remove existing final output if it exists
-            if final_output_path.exists():
-                shutil.rmtree(final_output_path)
-                self.logger.info(f"Removed existing final output: {final_output_path}")
-
-            # Copy to final output
-            shutil.copytree(str(source_output), str(final_output_path))
-            self.logger.info(f"Final output created: {final_output_path}")
+            # Move Project 32's output into the artifact directory and reference it from
+            # both Project 32 and the final output location
+            artifact = self.artifacts.publish("output_analysis", source_output, stage="project_32")
+            self.artifacts.reference("output_analysis", source_output)
+            link_method = self.artifacts.reference("output_analysis", final_output_path)
+            self.logger.info(f"Final output created: {final_output_path} -> {artifact} ({link_method})")
 
             return True
 
@@ -724,13 +762,21 @@ class ProjectOrchestrator:
                 if not self.check_project_dependencies(30):
                     self.logger.warning("Project 30 dependency check failed, but continuing anyway...")
 
-            if not self.run_project(30):
+            run_fingerprint = fingerprint_values(self.execution_date)
+            project_31_videos = Config.PROJECT_31_PATH / "youtube-sentiment-analyzer"
+
+            if not self.run_ledger_unit("collect", "project_30", run_fingerprint,
+                                        lambda: self.run_project(30),
+                                        output_exists=lambda: bool(self.find_videos_folders())):
                 self.logger.error("Project 30 execution failed")
                 return False
 
             # Step 2: Transfer Project 30 output to Project 31
             self.logger.info("STEP 2: Transferring Project 30 output to Project 31")
-            if not self.transfer_output(30, 31):
+            if not self.run_ledger_unit("transfer", "30_to_31", run_fingerprint,
+                                        lambda: self.transfer_output(30, 31),
+                                        output_exists=lambda: any(project_31_videos in folder.parents
+                                                                  for folder in self.find_videos_folders())):
                 self.logger.error("Failed to transfer Project 30 output to Project 31")
                 return False
 
@@ -746,9 +792,13 @@ class ProjectOrchestrator:
                 self.logger.error("Failed to transfer Project 31 output to Project 32")
                 return False
 
-            # Step 5: Run Project 32
+            # Step 5: Run Project 32 (rerun on resume if the set of analyses changed)
             self.logger.info("STEP 5: Executing Project 32")
-            if not self.run_project(32):
+            project_32_input = Config.PROJECT_32_PATH / self.input_32
+            analyses_fingerprint = fingerprint_values(*sorted(item.name for item in project_32_input.iterdir()))
+            if not self.run_ledger_unit("aggregate", "project_32", analyses_fingerprint,
+                                        lambda: self.run_project(32),
+                                        output_exists=lambda: validate_path(Config.PROJECT_32_PATH / self.output_32)):
                 self.logger.error("Project 32 execution failed")
                 return False
 
@@ -761,9 +811,212 @@ class ProjectOrchestrator:
             self.logger.info("=" * 60)
             self.logger.info("WORKFLOW ORCHESTRATION COMPLETED SUCCESSFULLY")
             self.logger.info("=" * 60)
+            self.log_ledger_summary()
 
             return True
 
         except Exception as e:
             self.logger.error(f"Unexpected error during workflow orchestration: {e}")
-            return False
\ No newline at end of file
+            self.log_ledger_summary()
+            return False
+
+    def log_ledger_summary(self) -> None:
+        """Log unit counts per stage and status from the run ledger"""
+        for stage, counts in self.ledger.summary().items():
+            details = ", ".join(f"{status}: {count}" for status, count in sorted(counts.items()))
+            self.logger.info(f"Ledger {stage}: {details}")
+
+    def find_videos_folders(self) -> list:
+        """List Project 30 output folders for the execution date, where Project 30 wrote them or after transfer"""
+        base_paths = [Config.PROJECT_30_PATH, Config.PROJECT_31_PATH / "youtube-sentiment-analyzer"]
+        folders = []
+        for base_path in base_paths:
+            for pattern in Config.OUTPUT_30_ALTERNATIVE_PATTERNS:
+                folder = base_path / pattern.format(date=self.execution_date)
+                if validate_path(folder) and folder not in folders:
+                    folders.append(folder)
+        return folders
+
+    def find_window_csv(self, days: int) -> Optional[Path]:
+        """Find the CSV Project 30 produced for the last_{days}_days window"""
+        for videos_folder in self.find_videos_folders():
+            window_folder = videos_folder / f"last_{days}_days"
+            if window_folder.is_dir():
+                csv_files = sorted(window_folder.glob("*.csv"))
+                if csv_files:
+                    return csv_files[0]
+        return None
+
+    def is_window_available(self, days: int) -> bool:
+        """
+        Check whether a window's CSV is complete
+
+        Project 30 writes the windows in order, so a window is final once the next
+        window's folder exists or collection has finished.
+        """
+        if self.collection_finished:
+            return True
+        if self.find_window_csv(days) is None:
+            return False
+        return any((videos_folder / f"last_{days + 1}_days").is_dir() for videos_folder in self.find_videos_folders())
+
+    def is_window_analyzed(self, days: int) -> bool:
+        """Check whether a finished analysis (with its overall results CSV) already exists for a window"""
+        prefix = f"analysis_results_most_viewed_last_{days}_days_"
+        date_compact = self.execution_date.replace("-", "")
+        search_paths = [
+            Config.PROJECT_31_PATH,
+            Config.PROJECT_31_PATH / self.input_32,
+            Config.PROJECT_32_PATH / self.input_32
+        ]
+        for search_path in search_paths:
+            if not search_path.is_dir():
+                continue
+            for item in search_path.iterdir():
+                if (item.is_dir() and item.name.startswith(prefix) and date_compact in item.name and
+                        any(item.glob("overall_sentiment_results_*.csv"))):
+                    return True
+        return False
+
+    def has_unorganized_analyses(self) -> bool:
+        """Check for analysis folders that still need to be moved into analysis_{date}"""
+        date_compact = self.execution_date.replace("-", "")
+        return any(item.is_dir() and item.name.startswith("analysis_results_most_viewed_last_") and
+                   date_compact in item.name for item in Config.PROJECT_31_PATH.iterdir())
+
+    def collect_videos(self) -> bool:
+        """Pipeline task: run Project 30 (collection and enrichment of every window)"""
+        try:
+            return self.run_project(30)
+        finally:
+            self.collection_finished = True
+
+    def run_project_31_csv_subprocess(self, csv_path: Path, label: str) -> bool:
+        """Run Project 31 on one CSV in a separate interpreter"""
+        youtube_analyzer_path = Config.PROJECT_31_PATH / "youtube-sentiment-analyzer"
+        python_executable = Config.PYTHON_EXECUTABLE or sys.executable
+        command = [python_executable, Config.get_project_script(31), str(csv_path.resolve())]
+
+        env = os.environ.copy()
+        env['EXECUTION_DATE'] = self.execution_date
+        env['TODAY_DATE'] = self.execution_date
+        env['PYTHONIOENCODING'] = 'utf-8'
+        if os.name == 'nt':  # Windows
+            env['PYTHONLEGACYWINDOWSSTDIO'] = '1'
+
+        self.logger.info(f"Running command: {' '.join(command)}")
+        result = run_streaming(command, self.logger, label, timeout=Config.PROJECT_TIMEOUT, env=env,
+                               cwd=youtube_analyzer_path)
+
+        if result.timed_out:
+            self.logger.error(f"TIMEOUT: {label} timed out after {Config.PROJECT_TIMEOUT} seconds")
+        return result.returncode == 0 and not result.timed_out
+
+    def analyze_window(self, days: int) -> bool:
+        """Pipeline task: run Project 31 on one window's CSV as soon as it lands"""
+        label = f"Window last_{days}_days"
+        csv_path = self.find_window_csv(days)
+        if csv_path is None:
+            self.logger.error(f"{label}: no CSV found")
+            return False
+
+        is_empty, empty_reason = self.check_csv_file_empty(csv_path)
+        if is_empty:
+            self.logger.warning(f"EMPTY CSV: {csv_path.name} - {empty_reason}")
+            return True
+
+        start_time = time.time()
+        if Config.PROJECT_31_IN_PROCESS:
+            with self.project_31_lock:
+                if self.project_31_analyzer is None:
+                    self.project_31_analyzer = load_project_31_analyzer(Config.PROJECT_31_PATH, self.logger)
+                if self.project_31_analyzer is not None:
+                    success = self.run_project_31_csv_in_process(self.project_31_analyzer, csv_path)
+                else:
+                    success = None
+            if success is None:
+                success = self.run_project_31_csv_subprocess(csv_path, label)
+        else:
+            success = self.run_project_31_csv_subprocess(csv_path, label)
+
+        execution_time = time.time() - start_time
+        if success:
+            self.logger.info(f"SUCCESS: {label} analyzed in {execution_time:.2f} seconds")
+        else:
+            # Like the sequential workflow, one failed CSV does not stop the rest;
+            # the window has no analysis folder, so a rerun retries it
+            self.logger.warning(f"WARNING: {label} analysis failed after {execution_time:.2f} seconds")
+        return True
+
+    def build_workflow_tasks(self) -> list:
+        """Build the workflow DAG: collect -> analyze (per window) -> organize -> transfer -> Project 32 -> final"""
+        windows = range(1, Config.PIPELINE_WINDOWS + 1)
+        analyze_names = [f"analyze_last_{days}_days" for days in windows]
+
+        tasks = [Task(
+            "collect", "collect", self.collect_videos,
+            is_complete=lambda: all(self.find_window_csv(days) is not None for days in windows)
+        )]
+
+        for days, name in zip(windows, analyze_names):
+            tasks.append(Task(
+                name, "analyze", lambda days=days: self.analyze_window(days),
+                is_complete=lambda days=days: self.is_window_analyzed(days),
+                is_available=lambda days=days: self.is_window_available(days)
+            ))
+
+        project_31_analysis = Config.PROJECT_31_PATH / self.input_32
+        project_32_analysis = Config.PROJECT_32_PATH / self.input_32
+        project_31_videos = Config.PROJECT_31_PATH / "youtube-sentiment-analyzer"
+
+        tasks.extend([
+            Task("transfer_30_31", "aggregate", lambda: self.transfer_output(30, 31),
+                 dependencies=["collect"] + analyze_names,
+                 is_complete=lambda: all(project_31_videos in folder.parents
+                                         for folder in self.find_videos_folders())),
+            Task("organize_31", "aggregate", self.organize_project_31_output,
+                 dependencies=analyze_names,
+                 is_complete=lambda: not self.has_unorganized_analyses()),
+            Task("transfer_31_32", "aggregate", lambda: self.transfer_output(31, 32),
+                 dependencies=["organize_31"],
+                 is_complete=lambda: project_32_analysis.exists() and not project_31_analysis.exists()),
+            Task("project_32", "aggregate", lambda: self.run_project(32),
+                 dependencies=["transfer_31_32"],
+                 is_complete=lambda: validate_path(Config.PROJECT_32_PATH / self.output_32)),
+            Task("final_output", "aggregate", self.create_final_output,
+                 dependencies=["project_32"],
+                 is_complete=lambda: validate_path(Path(self.final_output)))
+        ])
+        return tasks
+
+    def run_pipelined_workflow(self) -> bool:
+        """Run the workflow as a DAG, analyzing each window as soon as Project 30 writes it"""
+        self.logger.info("=" * 60)
+        self.logger.info("STARTING PIPELINED WORKFLOW ORCHESTRATION")
+        self.logger.info("=" * 60)
+
+        try:
+            if not self.validate_all_projects():
+                self.logger.error("Project validation failed")
+                return False
+
+            if Config.ENABLE_DEPENDENCY_CHECK:
+                if not self.check_project_dependencies(30):
+                    self.logger.warning("Project 30 dependency check failed, but continuing anyway...")
+
+            scheduler = DagScheduler(Config.PIPELINE_STAGE_LIMITS, self.logger, Config.PIPELINE_POLL_INTERVAL)
+            states = scheduler.run(self.build_workflow_tasks())
+
+            failed = [name for name, state in states.items() if state not in ("done", "skipped")]
+            if failed:
+                self.logger.error(f"Pipelined workflow incomplete, tasks not finished: {', '.join(failed)}")
+                return False
+
+            self.logger.info("=" * 60)
+            self.logger.info("PIPELINED WORKFLOW COMPLETED SUCCESSFULLY")
+            self.logger.info("=" * 60)
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Unexpected error during pipelined workflow: {e}")
+            return False
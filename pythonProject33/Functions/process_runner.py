@@ -0,0 +1,117 @@
+"""
+Streaming subprocess execution for Project 33
+Forwards a child's stdout/stderr to the logger line by line while it runs
+"""
+
+import logging
+import os
+import subprocess
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+# Lines of each stream kept after forwarding (for error checks once the child exits)
+MAX_BUFFERED_LINES = 200
+
+# Seconds to wait after terminate() before kill() on timeout
+TERMINATE_GRACE_PERIOD = 10
+
+
+class StreamingResult:
+    """Outcome of a streamed subprocess run"""
+
+    def __init__(self, returncode: Optional[int], stdout_tail: List[str], stderr_tail: List[str],
+                 timed_out: bool, execution_time: float):
+        self.returncode = returncode
+        self.stdout_tail = stdout_tail
+        self.stderr_tail = stderr_tail
+        self.timed_out = timed_out
+        self.execution_time = execution_time
+
+    @property
+    def stderr(self) -> str:
+        return "\n".join(self.stderr_tail)
+
+
+def _forward_stream(stream, log_method, label: str, buffer: deque) -> None:
+    """Read a pipe until EOF, logging every non-empty line and keeping the last ones"""
+    try:
+        for line in stream:
+            line = line.rstrip('\r\n')
+            if line.strip():
+                log_method(f"  [{label}] {line}")
+                buffer.append(line)
+    finally:
+        stream.close()
+
+
+def run_streaming(command: List[str], logger: logging.Logger, label: str, timeout: Optional[float] = None,
+                  env: Optional[Dict[str, str]] = None, cwd: Optional[Path] = None,
+                  max_buffered_lines: int = MAX_BUFFERED_LINES) -> StreamingResult:
+    """
+    Run a command, streaming its output to the logger in real time
+
+    Both pipes are drained concurrently by reader threads, so a chatty child can
+    never block on a full pipe, and memory stays bounded by max_buffered_lines.
+    On timeout the child is terminated (then killed); everything it printed up
+    to that point has already been logged.
+
+    Args:
+        command: Command and arguments
+        logger: Logger receiving stdout (INFO) and stderr (WARNING) lines
+        label: Prefix identifying the child in the log
+        timeout: Seconds before the child is stopped (None for no limit)
+        env: Environment for the child
+        cwd: Working directory for the child
+        max_buffered_lines: Lines of each stream kept in the result
+
+    Returns:
+        StreamingResult with the exit code, the last lines of each stream and the timeout flag
+    """
+    # Python children block-buffer stdout when it is a pipe; ask them to flush every line
+    env = dict(env if env is not None else os.environ)
+    env.setdefault('PYTHONUNBUFFERED', '1')
+
+    start_time = time.time()
+    process = subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding='utf-8',
+        errors='replace',  # Replace problematic characters instead of failing
+        bufsize=1,
+        env=env,
+        cwd=cwd
+    )
+
+    stdout_tail = deque(maxlen=max_buffered_lines)
+    stderr_tail = deque(maxlen=max_buffered_lines)
+    readers = [
+        threading.Thread(target=_forward_stream, args=(process.stdout, logger.info, label, stdout_tail), daemon=True),
+        threading.Thread(target=_forward_stream, args=(process.stderr, logger.warning, label, stderr_tail), daemon=True)
+    ]
+    for reader in readers:
+        reader.start()
+
+    timed_out = False
+    try:
+        process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        timed_out = True
+        process.terminate()
+        try:
+            process.wait(timeout=TERMINATE_GRACE_PERIOD)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+    # Pipes hit EOF once the child (and anything holding its pipes) has exited
+    for reader in readers:
+        reader.join(timeout=TERMINATE_GRACE_PERIOD)
+
+    return StreamingResult(process.returncode, list(stdout_tail), list(stderr_tail), timed_out,
+                           time.time() - start_time)
@@ -0,0 +1,86 @@
+"""
+In-process project loading for Project 33
+Imports another project's Functions package once so it can run without a new interpreter
+"""
+
+import importlib
+import importlib.util
+import multiprocessing
+import os
+import sys
+from pathlib import Path
+from typing import Optional
+
+
+# Project 31's package is also called "Functions", so it is imported under this name instead
+PROJECT_31_PACKAGE_ALIAS = "project_31_functions"
+
+
+def load_package_under_alias(package_dir: Path, alias: str):
+    """
+    Import a package directory under a different top-level name
+
+    Relative imports inside the package resolve against the alias, so it can
+    coexist with an already imported package of the same name.
+
+    Args:
+        package_dir: Directory containing the package modules
+        alias: Module name to register the package under
+
+    Returns:
+        The imported package module
+    """
+    if alias in sys.modules:
+        return sys.modules[alias]
+
+    init_file = package_dir / "__init__.py"
+    if init_file.exists():
+        spec = importlib.util.spec_from_file_location(alias, init_file,
+                                                      submodule_search_locations=[str(package_dir)])
+    else:
+        # Namespace package (no __init__.py)
+        spec = importlib.util.spec_from_loader(alias, None, is_package=True)
+        spec.submodule_search_locations = [str(package_dir)]
+
+    package = importlib.util.module_from_spec(spec)
+    sys.modules[alias] = package
+    if spec.loader is not None:
+        spec.loader.exec_module(package)
+    return package
+
+
+def load_project_31_analyzer(project_31_path: Path, logger=None) -> Optional[type]:
+    """
+    Import Project 31's YouTubeSentimentAnalyzer class once for in-process runs
+
+    Args:
+        project_31_path: Project 31 root directory
+        logger: Logger for import errors (optional)
+
+    Returns:
+        The analyzer class, or None if Project 31 could not be imported
+    """
+    functions_dir = Path(project_31_path).resolve() / "youtube-sentiment-analyzer" / "Functions"
+
+    # Plots are only saved, never shown, when running inside the orchestrator
+    os.environ.setdefault('MPLBACKEND', 'Agg')
+
+    try:
+        load_package_under_alias(functions_dir, PROJECT_31_PACKAGE_ALIAS)
+
+        # Spawned worker processes cannot re-import the aliased package, so score segments
+        # and render plots in-process unless workers are forked from this interpreter
+        # (set before the analyzer is imported, which binds these settings as defaults)
+        if multiprocessing.get_start_method() != 'fork':
+            sentiment_module = importlib.import_module(f"{PROJECT_31_PACKAGE_ALIAS}.sentiment_analysis")
+            sentiment_module.SCORING_WORKERS = 1
+            visualization_module = importlib.import_module(f"{PROJECT_31_PACKAGE_ALIAS}.visualization")
+            visualization_module.RENDER_IN_BACKGROUND = False
+
+        analyzer_module = importlib.import_module(f"{PROJECT_31_PACKAGE_ALIAS}.analyzer")
+        return analyzer_module.YouTubeSentimentAnalyzer
+    except Exception as e:
+        sys.modules.pop(PROJECT_31_PACKAGE_ALIAS, None)
+        if logger:
+            logger.warning(f"Could not import Project 31 in-process: {e}")
+        return None
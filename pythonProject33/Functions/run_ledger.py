@@ -0,0 +1,117 @@
+"""
+Run ledger for Project 33
+Durable record of every workflow unit (stage, window or video), so a rerun can resume
+"""
+
+import hashlib
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+
+# Unit states
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+
+def fingerprint_file(path: Path) -> str:
+    """Content hash of a file (empty string if it cannot be read)"""
+    digest = hashlib.sha1()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+    except OSError:
+        return ""
+    return digest.hexdigest()
+
+
+def fingerprint_values(*values) -> str:
+    """Hash of a few identifying values (dates, names, settings)"""
+    return hashlib.sha1("|".join(str(value) for value in values).encode('utf-8')).hexdigest()
+
+
+class RunLedger:
+    """SQLite ledger of workflow units keyed by (run date, stage, unit)"""
+
+    def __init__(self, db_path: Path, run_date: str):
+        """
+        Args:
+            db_path: SQLite file holding the ledger (created if missing)
+            run_date: Execution date the recorded units belong to
+        """
+        self.db_path = Path(db_path)
+        self.run_date = run_date
+        self.lock = threading.Lock()
+
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS units ("
+            " run_date TEXT NOT NULL,"
+            " stage TEXT NOT NULL,"
+            " unit TEXT NOT NULL,"
+            " fingerprint TEXT NOT NULL,"
+            " status TEXT NOT NULL,"
+            " started_at TEXT,"
+            " finished_at TEXT,"
+            " detail TEXT,"
+            " PRIMARY KEY (run_date, stage, unit))"
+        )
+        self.conn.commit()
+
+    def is_done(self, stage: str, unit: str, fingerprint: str) -> bool:
+        """Check whether a unit completed with the same input fingerprint"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT status, fingerprint FROM units WHERE run_date = ? AND stage = ? AND unit = ?",
+                (self.run_date, stage, unit)
+            ).fetchone()
+        return row is not None and row[0] == DONE and row[1] == fingerprint
+
+    def start(self, stage: str, unit: str, fingerprint: str) -> None:
+        """Record that a unit started"""
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO units (run_date, stage, unit, fingerprint, status, started_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (self.run_date, stage, unit, fingerprint, RUNNING, datetime.now().isoformat(timespec='seconds'))
+            )
+            self.conn.commit()
+
+    def finish(self, stage: str, unit: str, status: str, detail: Optional[str] = None,
+               fingerprint: Optional[str] = None) -> None:
+        """Record a unit's final status (creating the row if start() was not called)"""
+        now = datetime.now().isoformat(timespec='seconds')
+        with self.lock:
+            updated = self.conn.execute(
+                "UPDATE units SET status = ?, finished_at = ?, detail = ?"
+                " WHERE run_date = ? AND stage = ? AND unit = ?",
+                (status, now, detail, self.run_date, stage, unit)
+            ).rowcount
+            if not updated:
+                self.conn.execute(
+                    "INSERT INTO units (run_date, stage, unit, fingerprint, status, started_at, finished_at, detail)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (self.run_date, stage, unit, fingerprint or "", status, now, now, detail)
+                )
+            self.conn.commit()
+
+    def summary(self) -> Dict[str, Dict[str, int]]:
+        """Count units per stage and status for this run date"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT stage, status, COUNT(*) FROM units WHERE run_date = ? GROUP BY stage, status",
+                (self.run_date,)
+            ).fetchall()
+        counts = {}
+        for stage, status, count in rows:
+            counts.setdefault(stage, {})[status] = count
+        return counts
+
+    def close(self) -> None:
+        with self.lock:
+            self.conn.close()
@@ -4,6 +4,7 @@ PyCharm Project 33 - Master Orchestrator
 Main entry point for the project workflow orchestration
 """
 
+import argparse
 import sys
 import os
 from datetime import datetime
@@ -20,19 +21,38 @@ from Functions.orchestrator import ProjectOrchestrator
 from Functions.config import Config
 
 
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description='PyCharm Project 33 - Master Orchestrator')
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Skip stages, CSVs and videos the run ledger records as completed for this date'
+    )
+    parser.add_argument(
+        '--date',
+        help='Execution date (YYYY-MM-DD) to run or resume (default: today)'
+    )
+    return parser.parse_args()
+
+
 def main():
     """Main entry point for Project 33"""
+    args = parse_arguments()
+
     print("=" * 70)
     print("          PyCharm Project 33 - Master Orchestrator")
     print("=" * 70)
 
     try:
-        # Initialize orchestrator with today's date
-        today = datetime.now().strftime('%Y-%m-%d')
-        orchestrator = ProjectOrchestrator(today)
+        # Initialize orchestrator with today's date (or the run being resumed)
+        today = args.date or datetime.now().strftime('%Y-%m-%d')
+        orchestrator = ProjectOrchestrator(today, resume=args.resume)
 
         # Display configuration
         print(f"Execution Date: {today}")
+        if args.resume:
+            print(f"Resume: skipping units completed in earlier runs ({Config.RUN_LEDGER_PATH})")
         print(f"Project 30 Path: {Config.PROJECT_30_PATH}")
         print(f"Project 31 Path: {Config.PROJECT_31_PATH}")
         print(f"Project 32 Path: {Config.PROJECT_32_PATH}")
@@ -44,7 +64,10 @@ def main():
         print("=" * 70)
 
         # Run the complete orchestration
-        success = orchestrator.run_complete_workflow()
+        if Config.PIPELINED_WORKFLOW:
+            success = orchestrator.run_pipelined_workflow()
+        else:
+            success = orchestrator.run_complete_workflow()
 
         if success:
             print("\n" + "=" * 70)